@@ -0,0 +1,16 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=64)
+def parse_color(value: Optional[str]) -> Optional[tuple[int, int, int]]:
+    if value is None:
+        return None
+    cleaned = value.replace("#", "").replace(" ", "")
+    if "," in cleaned:
+        parts = cleaned.split(",")
+        return tuple(int(part) for part in parts[:3])
+    if len(cleaned) == 6:
+        return tuple(bytes.fromhex(cleaned))
+    raise ValueError("Invalid color")
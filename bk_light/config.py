@@ -1,31 +1,53 @@
 from __future__ import annotations
 import os
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+_CLOCK_FORMATS = frozenset({"12h", "24h"})
+_TEXT_MODES = frozenset({"static", "scroll"})
+_TEXT_DIRECTIONS = frozenset({"left", "right"})
+_IMAGE_MODES = frozenset({"fit", "cover", "scale"})
+_ROTATIONS = frozenset({0, 90, 180, 270})
+_PANEL_ROTATIONS = _ROTATIONS | {None}
+_TEXT_INT_FIELDS = frozenset({"size", "spacing", "gap", "offset_x", "offset_y", "step"})
+_TEXT_FLOAT_FIELDS = frozenset({"speed", "interval"})
+
 
 def _clamp(value: float, lower: float, upper: float) -> float:
     return max(lower, min(upper, value))
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size only take part in the cache key so edits invalidate it.
     try:
         import yaml
     except ImportError:
         raise ImportError("PyYAML is required. Install it with: pip install PyYAML")
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path).read_bytes(), Loader=loader) or {}
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+    return _parse_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
 def _merge_dict(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    # Only nodes on an override path are copied; untouched subtrees stay shared with base.
+    if not overrides:
+        return base
     result = dict(base)
     for key, value in overrides.items():
-        if isinstance(value, dict) and isinstance(result.get(key), dict):
-            result[key] = _merge_dict(result[key], value)
-        else:
-            result[key] = value
+        current = result.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            value = _merge_dict(current, value)
+        result[key] = value
     return result
 
 
@@ -85,6 +107,8 @@ class DeviceConfig:
     brightness: float = 0.85
     timezone: str = "auto"
     scan_timeout: float = 6.0
+    palette_png: bool = False
+    write_without_response: bool = False
 
 
 @dataclass
@@ -114,12 +138,27 @@ class PanelsConfig:
     items: list[PanelDescriptor] = field(default_factory=list)
 
 
-@dataclass
 class PresetLibrary:
-    clock: Dict[str, ClockPreset] = field(default_factory=dict)
-    text: Dict[str, TextPreset] = field(default_factory=dict)
-    image: Dict[str, ImagePreset] = field(default_factory=dict)
-    counter: Dict[str, CounterPreset] = field(default_factory=dict)
+    """Per-mode preset tables, each validated from the raw YAML data on first access."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        self._data = data or {}
+
+    @cached_property
+    def clock(self) -> Dict[str, ClockPreset]:
+        return _build_clock_presets(self._data.get("clock", {}))
+
+    @cached_property
+    def text(self) -> Dict[str, TextPreset]:
+        return _build_text_presets(self._data.get("text", {}))
+
+    @cached_property
+    def image(self) -> Dict[str, ImagePreset]:
+        return _build_image_presets(self._data.get("image", {}))
+
+    @cached_property
+    def counter(self) -> Dict[str, CounterPreset]:
+        return _build_counter_presets(self._data.get("counter", {}))
 
 
 @dataclass
@@ -148,6 +187,8 @@ DEFAULTS: Dict[str, Any] = {
         "brightness": 0.85,
         "timezone": "auto",
         "scan_timeout": 6.0,
+        "palette_png": False,
+        "write_without_response": False,
     },
     "panels": {
         "tile_width": 32,
@@ -223,7 +264,7 @@ def _build_clock_presets(data: Dict[str, Dict[str, Any]]) -> Dict[str, ClockPres
         if preset.dot_flashing and preset.interval > 0.5:
             preset.interval = 0.5
         preset.interval = max(preset.interval, 0.1)
-        if preset.format not in {"12h", "24h"}:
+        if preset.format not in _CLOCK_FORMATS:
             preset.format = "24h"
         preset.dot_flash_period = max(preset.dot_flash_period, 0.2)
         presets[name] = preset
@@ -236,9 +277,9 @@ def _build_text_presets(data: Dict[str, Dict[str, Any]]) -> Dict[str, TextPreset
     presets: Dict[str, TextPreset] = {}
     for name, values in data.items():
         preset = TextPreset(**values)
-        if preset.mode not in {"static", "scroll"}:
+        if preset.mode not in _TEXT_MODES:
             preset = replace(preset, mode="static")
-        if preset.direction not in {"left", "right"}:
+        if preset.direction not in _TEXT_DIRECTIONS:
             preset = replace(preset, direction="left")
         speed = max(1.0, float(preset.speed))
         gap = max(0, int(preset.gap))
@@ -268,9 +309,9 @@ def _build_image_presets(data: Dict[str, Dict[str, Any]]) -> Dict[str, ImagePres
     presets: Dict[str, ImagePreset] = {}
     for name, values in data.items():
         preset = ImagePreset(**values)
-        if preset.mode not in {"fit", "cover", "scale"}:
+        if preset.mode not in _IMAGE_MODES:
             preset.mode = "fit"
-        if preset.rotate not in {0, 90, 180, 270}:
+        if preset.rotate not in _ROTATIONS:
             preset.rotate = 0
         presets[name] = preset
     if "default" not in presets:
@@ -313,7 +354,7 @@ def _build_panels(data: Dict[str, Any]) -> PanelsConfig:
             grid_x = int(entry.get("grid_x", 0))
             grid_y = int(entry.get("grid_y", 0))
             rotation = entry.get("rotation")
-            if rotation not in {None, 0, 90, 180, 270}:
+            if rotation not in _PANEL_ROTATIONS:
                 rotation = None
             brightness = entry.get("brightness")
             if brightness is not None:
@@ -345,52 +386,65 @@ def _build_panels(data: Dict[str, Any]) -> PanelsConfig:
     )
 
 
-def load_config(path: Optional[Path] = None) -> AppConfig:
-    path = path or Path("config.yaml")
-    overrides = _load_yaml(path)
-    merged = _merge_dict(DEFAULTS, overrides)
-    device_data = merged.get("device", {})
-    device = DeviceConfig(**device_data)
+def _build_device(data: Dict[str, Any]) -> DeviceConfig:
+    device = DeviceConfig(**data)
     brightness = _clamp(device.brightness, 0.1, 1.0)
     scan_timeout = max(1.0, device.scan_timeout)
-    if device.rotate not in {0, 90, 180, 270}:
+    if device.rotate not in _ROTATIONS:
         device = replace(device, rotate=0)
-    device = replace(device, brightness=brightness, scan_timeout=scan_timeout)
+    return replace(device, brightness=brightness, scan_timeout=scan_timeout)
+
+
+def _build_runtime(data: Dict[str, Any]) -> RuntimeConfig:
+    return RuntimeConfig(
+        mode=data.get("mode", "clock"),
+        preset=data.get("preset", "default"),
+        options=data.get("options", {}) or {},
+    )
+
+
+_SECTION_BUILDERS = {
+    "device": _build_device,
+    "display": lambda data: DisplayConfig(**data),
+    "panels": _build_panels,
+    "presets": PresetLibrary,
+    "runtime": _build_runtime,
+}
+
+# Sections built once from DEFAULTS and shared by every config whose YAML leaves them out.
+# Callers swap sections with dataclasses.replace rather than mutating them in place.
+_DEFAULT_SECTIONS: Dict[str, Any] = {name: build(DEFAULTS[name]) for name, build in _SECTION_BUILDERS.items()}
+
+
+def load_config(path: Optional[Path] = None) -> AppConfig:
+    path = path or Path("config.yaml")
+    overrides = _load_yaml(path)
+    sections = dict(_DEFAULT_SECTIONS)
+    for name, values in overrides.items():
+        build = _SECTION_BUILDERS.get(name)
+        if build is None or not isinstance(values, dict):
+            continue
+        sections[name] = build(_merge_dict(DEFAULTS[name], values))
     env_address = os.getenv("BK_LIGHT_ADDRESS")
     if env_address:
-        device = replace(device, address=env_address)
-    display = DisplayConfig(**merged.get("display", {}))
-    panels = _build_panels(merged.get("panels", {}))
-    presets_data = merged.get("presets", {})
-    preset_library = PresetLibrary(
-        clock=_build_clock_presets(presets_data.get("clock", {})),
-        text=_build_text_presets(presets_data.get("text", {})),
-        image=_build_image_presets(presets_data.get("image", {})),
-        counter=_build_counter_presets(presets_data.get("counter", {})),
-    )
-    runtime_data = merged.get("runtime", {})
-    runtime = RuntimeConfig(
-        mode=runtime_data.get("mode", "clock"),
-        preset=runtime_data.get("preset", "default"),
-        options=runtime_data.get("options", {}) or {},
-    )
-    return AppConfig(
-        device=device,
-        display=display,
-        panels=panels,
-        presets=preset_library,
-        runtime=runtime,
-    )
+        sections["device"] = replace(sections["device"], address=env_address)
+    return AppConfig(**sections)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(item.name for item in fields(cls))
+
+
+def _preset_overrides(cls: type, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    names = _field_names(cls)
+    return {key: value for key, value in overrides.items() if value is not None and key in names}
 
 
 def clock_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]) -> ClockPreset:
     library = config.presets.clock
     base = library.get(preset_name) or library.get(config.runtime.preset) or library.get("default") or ClockPreset()
-    data = dict(base.__dict__)
-    for key, value in overrides.items():
-        if value is not None and key in data:
-            data[key] = value
-    preset = ClockPreset(**data)
+    preset = replace(base, **_preset_overrides(ClockPreset, overrides))
     if preset.dot_flashing and preset.interval > 0.5:
         preset.interval = 0.5
     preset.interval = max(preset.interval, 0.1)
@@ -400,21 +454,11 @@ def clock_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]
 def text_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]) -> TextPreset:
     library = config.presets.text
     base = library.get(preset_name) or library.get(config.runtime.preset) or library.get("default") or TextPreset(step=1)
-    data = dict(base.__dict__)
-    for key, value in overrides.items():
-        if value is None or key not in data:
-            continue
-        if key in {"size", "spacing", "gap", "offset_x", "offset_y", "step"}:
-            data[key] = int(value)
-        elif key in {"speed", "interval"}:
-            data[key] = float(value)
-        else:
-            data[key] = value
-    preset = TextPreset(**data)
-    if preset.mode not in {"static", "scroll"}:
-        preset = replace(preset, mode="static")
-    if preset.direction not in {"left", "right"}:
-        preset = replace(preset, direction="left")
+    data = {
+        key: int(value) if key in _TEXT_INT_FIELDS else float(value) if key in _TEXT_FLOAT_FIELDS else value
+        for key, value in _preset_overrides(TextPreset, overrides).items()
+    }
+    preset = replace(base, **data)
     speed = max(1.0, float(preset.speed))
     interval = max(0.01, float(preset.interval))
     if preset.step is None:
@@ -423,6 +467,8 @@ def text_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any])
         computed_step = max(1, int(preset.step))
     return replace(
         preset,
+        mode=preset.mode if preset.mode in _TEXT_MODES else "static",
+        direction=preset.direction if preset.direction in _TEXT_DIRECTIONS else "left",
         speed=speed,
         gap=max(0, int(preset.gap)),
         offset_x=int(preset.offset_x),
@@ -435,14 +481,10 @@ def text_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any])
 def image_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]) -> ImagePreset:
     library = config.presets.image
     base = library.get(preset_name) or library.get(config.runtime.preset) or library.get("default") or ImagePreset()
-    data = dict(base.__dict__)
-    for key, value in overrides.items():
-        if value is not None and key in data:
-            data[key] = value
-    preset = ImagePreset(**data)
-    if preset.mode not in {"fit", "cover", "scale"}:
+    preset = replace(base, **_preset_overrides(ImagePreset, overrides))
+    if preset.mode not in _IMAGE_MODES:
         preset.mode = "fit"
-    if preset.rotate not in {0, 90, 180, 270}:
+    if preset.rotate not in _ROTATIONS:
         preset.rotate = 0
     return preset
 
@@ -450,9 +492,4 @@ def image_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]
 def counter_options(config: AppConfig, preset_name: str, overrides: Dict[str, Any]) -> CounterPreset:
     library = config.presets.counter
     base = library.get(preset_name) or library.get(config.runtime.preset) or library.get("default") or CounterPreset()
-    data = dict(base.__dict__)
-    for key, value in overrides.items():
-        if value is not None and key in data:
-            data[key] = value
-    return CounterPreset(**data)
-
+    return replace(base, **_preset_overrides(CounterPreset, overrides))
@@ -1,13 +1,30 @@
 import asyncio
-import binascii
 import os
+import struct
+import time
+from functools import lru_cache
 from io import BytesIO
 from typing import Optional
 from bleak import BleakClient, BleakScanner
+from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from PIL import Image, ImageEnhance
+from PIL import Image
+
+try:
+    from zlib_ng.zlib_ng import crc32  # PCLMUL-folded CRC32, same polynomial as PNG
+except ImportError:
+    try:
+        from isal.isal_zlib import crc32  # ISA-L's CLMUL CRC32, same polynomial
+    except ImportError:
+        from binascii import crc32
+
+try:
+    import zopfli.png as zopfli_png
+except ImportError:
+    zopfli_png = None
 
 DEFAULT_ADDRESS = os.getenv("BK_LIGHT_ADDRESS")
+DEVICE_CACHE_TTL = 30.0
 UUID_WRITE = "0000fa02-0000-1000-8000-00805f9b34fb"
 UUID_NOTIFY = "0000fa03-0000-1000-8000-00805f9b34fb"
 HANDSHAKE_FIRST = bytes.fromhex("08 00 01 80 0E 06 32 00")
@@ -18,37 +35,145 @@ ACK_STAGE_TWO = bytes.fromhex("08 00 05 80 0B 03 07 02")
 ACK_STAGE_TWO_ALT = bytes.fromhex("08 00 05 80 0E 03 07 01")  # ACT1025 64x16 variant
 ACK_STAGE_THREE = bytes.fromhex("05 00 02 00 03")
 FRAME_VALIDATION = bytes.fromhex("05 00 00 01 00")
+ACK_LENGTHS = frozenset(
+    len(ack) for ack in (ACK_STAGE_ONE, ACK_STAGE_ONE_ALT, ACK_STAGE_TWO, ACK_STAGE_TWO_ALT, ACK_STAGE_THREE)
+)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PALETTE_MAX_COLORS = 16
+# total length, opcode, reserved, payload length, reserved, CRC32, trailer
+FRAME_HEADER = struct.Struct("<HB2sH2sI2s")
 
 
 def bytes_to_hex(data: bytes) -> str:
-    return "-".join(f"{value:02X}" for value in data)
+    return data.hex("-").upper()
+
+
+@lru_cache(maxsize=16)
+def _png_crc(png_bytes: bytes) -> int:
+    # Clock and static text resend identical payloads; bytes caches its own hash.
+    return crc32(png_bytes)
 
 
 def build_frame(png_bytes: bytes) -> bytes:
     data_length = len(png_bytes)
-    total_length = data_length + 15
-    frame = bytearray()
-    frame += total_length.to_bytes(2, "little")
-    frame.append(0x02)
-    frame += b"\x00\x00"
-    frame += data_length.to_bytes(2, "little")
-    frame += b"\x00\x00"
-    frame += binascii.crc32(png_bytes).to_bytes(4, "little")
-    frame += b"\x00\x65"
-    frame += png_bytes
-    return bytes(frame)
+    header = FRAME_HEADER.pack(
+        data_length + FRAME_HEADER.size,
+        0x02,
+        b"\x00\x00",
+        data_length,
+        b"\x00\x00",
+        _png_crc(bytes(png_bytes)),
+        b"\x00\x65",
+    )
+    return header + png_bytes
+
+
+FLOAT32 = struct.Struct("f")
+
+
+def _float32(value: float) -> float:
+    return FLOAT32.unpack(FLOAT32.pack(value))[0]
+
+
+@lru_cache(maxsize=8)
+def _brightness_lut(brightness: float) -> list[int]:
+    # ImageEnhance.Brightness blends against black in C floats and truncates;
+    # doing the same single-precision steps keeps every level bit-identical.
+    factor = _float32(brightness)
+    return [max(0, min(255, int(_float32(factor * value)))) for value in range(256)] * 3
+
+
+def _is_rgb8_png(png_bytes: bytes) -> bool:
+    # IHDR bit depth and colour type sit at fixed offsets right after the signature.
+    return png_bytes[:8] == PNG_SIGNATURE and png_bytes[24:26] == b"\x08\x02"
 
 
 def adjust_image(png_bytes: bytes, rotation: int, brightness: float) -> bytes:
-    image = Image.open(BytesIO(png_bytes)).convert("RGB")
-    if rotation:
-        image = image.rotate(rotation % 360, expand=False)
-    if brightness != 1.0:
-        enhancer = ImageEnhance.Brightness(image)
-        image = enhancer.enhance(brightness)
+    if not rotation % 360 and brightness == 1.0 and _is_rgb8_png(png_bytes):
+        return png_bytes
+    return _adjust_image_cached(bytes(png_bytes), rotation, brightness)
+
+
+@lru_cache(maxsize=32)
+def _adjust_image_cached(png_bytes: bytes, rotation: int, brightness: float) -> bytes:
+    return adjust_image_pil(Image.open(BytesIO(png_bytes)), rotation, brightness)
+
+
+def adjust_image_pil(
+    image: Image.Image,
+    rotation: int,
+    brightness: float,
+    optimize: bool = False,
+    palette: bool = False,
+) -> bytes:
+    """Rotate and dim a PIL image, then encode it as the PNG the panel expects.
+
+    Encoding happens exactly once, so callers holding a PIL image should use this
+    instead of saving a PNG and passing it through adjust_image. ``optimize`` is
+    meant for frames built once and sent many times: it spends extra CPU (including
+    a zopfli pass when installed) for the smallest payload over BLE. With ``palette``
+    a ``P`` mode image stays paletted and brightness is applied to its palette.
+    """
+    if palette and image.mode == "P" and _is_transpose(image, rotation):
+        image = _adjust_palette_image(image, rotation, brightness)
+    else:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        if rotation % 360:
+            image = _rotate(image, rotation)
+        if brightness != 1.0:
+            image = image.point(_brightness_lut(brightness))
     buffer = BytesIO()
-    image.save(buffer, format="PNG", optimize=False)
-    return buffer.getvalue()
+    if not optimize:
+        image.save(buffer, format="PNG", optimize=False)
+        return buffer.getvalue()
+    image.save(buffer, format="PNG", optimize=True, compress_level=9)
+    png_bytes = buffer.getvalue()
+    if zopfli_png is not None:
+        # zopflipng may switch colour type on its own; only keep smaller output of the same type.
+        candidate = zopfli_png.optimize(png_bytes)
+        if len(candidate) < len(png_bytes) and candidate[24:26] == png_bytes[24:26]:
+            png_bytes = candidate
+    return png_bytes
+
+
+def _exact_palette(image: Image.Image, max_colors: int = PALETTE_MAX_COLORS) -> Optional[Image.Image]:
+    """Losslessly convert a few-colour RGB image (text, counters) to P mode, else None."""
+    colors = image.getcolors(maxcolors=max_colors)
+    if colors is None:
+        return None
+    palette = Image.new("P", (1, 1))
+    palette.putpalette([channel for _, rgb in colors for channel in rgb])
+    return image.quantize(palette=palette, dither=Image.Dither.NONE)
+
+
+_TRANSPOSE = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+
+def _is_transpose(image: Image.Image, rotation: int) -> bool:
+    # Quarter turns only map onto a pixel reorder when the tile is square; with
+    # expand=False a non-square tile is cropped and padded by rotate() instead.
+    rotation %= 360
+    return rotation in (0, 180) or (rotation in _TRANSPOSE and image.width == image.height)
+
+
+def _rotate(image: Image.Image, rotation: int) -> Image.Image:
+    rotation %= 360
+    if _is_transpose(image, rotation):
+        return image.transpose(_TRANSPOSE[rotation])
+    return image.rotate(rotation, expand=False)
+
+
+def _adjust_palette_image(image: Image.Image, rotation: int, brightness: float) -> Image.Image:
+    image = _rotate(image, rotation) if rotation % 360 else image.copy()
+    if brightness != 1.0:
+        lut = _brightness_lut(brightness)
+        image.putpalette([lut[value] for value in image.getpalette()])
+    return image
 
 
 class AckWatcher:
@@ -57,6 +182,13 @@ class AckWatcher:
         self.stage_two = asyncio.Event()
         self.stage_three = asyncio.Event()
         self.verbose = verbose
+        self._events = {
+            ACK_STAGE_ONE: self.stage_one,
+            ACK_STAGE_ONE_ALT: self.stage_one,
+            ACK_STAGE_TWO: self.stage_two,
+            ACK_STAGE_TWO_ALT: self.stage_two,
+            ACK_STAGE_THREE: self.stage_three,
+        }
 
     def reset(self) -> None:
         self.stage_one.clear()
@@ -64,15 +196,13 @@ class AckWatcher:
         self.stage_three.clear()
 
     def handler(self, _sender: int, data: bytearray) -> None:
-        payload = bytes(data)
         if self.verbose:
-            print("NOTIF", bytes_to_hex(payload))
-        if payload == ACK_STAGE_ONE or payload == ACK_STAGE_ONE_ALT:
-            self.stage_one.set()
-        elif payload == ACK_STAGE_TWO or payload == ACK_STAGE_TWO_ALT:
-            self.stage_two.set()
-        elif payload == ACK_STAGE_THREE:
-            self.stage_three.set()
+            print("NOTIF", bytes_to_hex(data))
+        if len(data) not in ACK_LENGTHS:
+            return
+        event = self._events.get(bytes(data))
+        if event is not None:
+            event.set()
 
 
 async def wait_for_ack(event: asyncio.Event, label: str, verbose: bool, timeout: float = 5.0) -> None:
@@ -98,6 +228,8 @@ class BleDisplaySession:
         log_notifications: bool = False,
         max_retries: int = 3,
         scan_timeout: float = 6.0,
+        palette_png: bool = False,
+        write_without_response: bool = False,
     ) -> None:
         resolved = address or DEFAULT_ADDRESS
         if not resolved:
@@ -111,9 +243,15 @@ class BleDisplaySession:
         self.log_notifications = log_notifications
         self.max_retries = max_retries
         self.scan_timeout = scan_timeout
+        self.palette_png = palette_png
+        self.write_without_response = write_without_response
         self.client: Optional[BleakClient] = None
         self.watcher = AckWatcher(log_notifications)
         self._skip_stage_two: Optional[bool] = None  # Learned from first frame
+        self._device: Optional[BLEDevice] = None
+        self._device_found_at = 0.0
+        self._last_frame: Optional[bytes] = None  # Last frame the panel acknowledged
+        self._last_encoded: Optional[tuple[tuple, bytes]] = None  # (pixel key, frame) of the last encode
 
     async def _safe_disconnect(self) -> None:
         if self.client is None:
@@ -130,6 +268,7 @@ class BleDisplaySession:
             pass
         finally:
             self.client = None
+            self._last_frame = None
 
     async def _connect(self) -> None:
         attempt = 0
@@ -140,25 +279,7 @@ class BleDisplaySession:
                     return
                 if self.client:
                     await self._safe_disconnect()
-                try:
-                    device = await BleakScanner.find_device_by_address(
-                        self.address, timeout=self.scan_timeout, cached=False
-                    )
-                except TypeError:
-                    device = await BleakScanner.find_device_by_address(
-                        self.address, timeout=self.scan_timeout
-                    )
-                if device is None:
-                    try:
-                        device = await BleakScanner.find_device_by_address(
-                            self.address, timeout=self.scan_timeout, cached=True
-                        )
-                    except TypeError:
-                        device = await BleakScanner.find_device_by_address(
-                            self.address, timeout=self.scan_timeout
-                        )
-                if device is None:
-                    raise BleakError(f"Device with address {self.address} was not found")
+                device = await self._find_device()
                 self.client = BleakClient(device)
                 self.watcher = AckWatcher(self.log_notifications)
                 await self.client.connect()
@@ -172,11 +293,39 @@ class BleDisplaySession:
                 await self.client.start_notify(UUID_NOTIFY, self.watcher.handler)
                 return
             except Exception as error:
+                self._device = None
                 if not self.auto_reconnect or attempt > self.max_retries:
                     await self._safe_disconnect()
                     raise error
                 await asyncio.sleep(self.reconnect_delay)
 
+    async def _find_device(self) -> BLEDevice:
+        """Return the scanned device, reusing the last result within DEVICE_CACHE_TTL."""
+        if self._device is not None and time.monotonic() - self._device_found_at < DEVICE_CACHE_TTL:
+            return self._device
+        try:
+            device = await BleakScanner.find_device_by_address(
+                self.address, timeout=self.scan_timeout, cached=False
+            )
+        except TypeError:
+            device = await BleakScanner.find_device_by_address(
+                self.address, timeout=self.scan_timeout
+            )
+        if device is None:
+            try:
+                device = await BleakScanner.find_device_by_address(
+                    self.address, timeout=self.scan_timeout, cached=True
+                )
+            except TypeError:
+                device = await BleakScanner.find_device_by_address(
+                    self.address, timeout=self.scan_timeout
+                )
+        if device is None:
+            raise BleakError(f"Device with address {self.address} was not found")
+        self._device = device
+        self._device_found_at = time.monotonic()
+        return device
+
     async def _ensure_connected(self) -> None:
         if not self.client or not self.client.is_connected:
             await self._connect()
@@ -188,12 +337,34 @@ class BleDisplaySession:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self._safe_disconnect()
 
-    async def send_png(self, png_bytes: bytes, delay: float = 0.2) -> None:
+    async def send_png(self, png_bytes: bytes, delay: float = 0.0) -> None:
         processed = adjust_image(png_bytes, self.rotation, self.brightness)
         frame = build_frame(processed)
         await self.send_frame(frame, delay)
 
-    async def send_frame(self, frame: bytes, delay: float = 0.2) -> None:
+    def encode_image(self, image: Image.Image) -> bytes:
+        """Apply this panel's rotation and brightness and wrap the PNG in a frame."""
+        # Multi-panel canvases often change only some tiles; comparing raw pixels is far cheaper
+        # than re-encoding, and send_frame then skips the unchanged frame entirely.
+        key = (self.rotation, self.brightness, image.mode, image.size, image.tobytes())
+        if self._last_encoded is not None and self._last_encoded[0] == key:
+            return self._last_encoded[1]
+        if self.palette_png and image.mode == "RGB":
+            image = _exact_palette(image) or image
+        frame = build_frame(adjust_image_pil(image, self.rotation, self.brightness, palette=self.palette_png))
+        self._last_encoded = (key, frame)
+        return frame
+
+    async def send_image(self, image: Image.Image, delay: float = 0.0) -> None:
+        await self.send_frame(self.encode_image(image), delay)
+
+    async def send_frame(self, frame: bytes, delay: float = 0.0) -> None:
+        # Each handshake write must be acknowledged before the next one is sent, so they
+        # cannot be coalesced; the frame itself goes out as one write and bleak fragments
+        # it to the negotiated MTU.
+        if frame == self._last_frame:
+            await asyncio.sleep(0)  # Still yield so tight send loops stay cancellable
+            return
         attempt = 0
         while True:
             attempt += 1
@@ -202,26 +373,19 @@ class BleDisplaySession:
                 self.watcher.reset()
                 await self.client.write_gatt_char(UUID_WRITE, HANDSHAKE_FIRST, response=False)
                 await wait_for_ack(self.watcher.stage_one, "HANDSHAKE_STAGE_ONE", self.log_notifications)
-                if delay > 0:
-                    await asyncio.sleep(delay)
                 self.watcher.stage_two.clear()
-                skip_stage_two = False
                 try:
                     await self.client.write_gatt_char(UUID_WRITE, HANDSHAKE_SECOND, response=False)
                     await wait_for_ack(self.watcher.stage_two, "HANDSHAKE_STAGE_TWO", self.log_notifications)
                 except asyncio.TimeoutError:
-                    skip_stage_two = True
                     if self.log_notifications:
                         print("HANDSHAKE_STAGE_TWO_SKIPPED")
-                else:
+                    # No ACK to pace on, so give the panel the configured settle time instead.
                     if delay > 0:
                         await asyncio.sleep(delay)
-                if skip_stage_two and delay > 0:
-                    await asyncio.sleep(delay)
-                await self.client.write_gatt_char(UUID_WRITE, frame, response=True)
+                await self.client.write_gatt_char(UUID_WRITE, frame, response=not self.write_without_response)
                 await wait_for_ack(self.watcher.stage_three, "FRAME_ACK", self.log_notifications)
-                if delay > 0:
-                    await asyncio.sleep(delay)
+                self._last_frame = frame
                 return
             except (asyncio.TimeoutError, BleakError, ConnectionError) as error:
                 if not self.auto_reconnect or attempt > self.max_retries:
@@ -243,6 +407,9 @@ class BleDisplaySession:
         - Learns to skip stage two after first frame if device doesn't respond
         - No inter-stage delays
         """
+        if frame == self._last_frame:
+            await asyncio.sleep(0)  # Still yield so tight send loops stay cancellable
+            return
         attempt = 0
         while True:
             attempt += 1
@@ -267,9 +434,10 @@ class BleDisplaySession:
                         if self.log_notifications:
                             print("HANDSHAKE_STAGE_TWO_SKIPPED (will skip wait for future frames)")
 
-                # Send frame - keep response=True as device requires it
-                await self.client.write_gatt_char(UUID_WRITE, frame, response=True)
+                # Send frame - stock firmware needs response=True; FRAME_ACK alone paces it otherwise
+                await self.client.write_gatt_char(UUID_WRITE, frame, response=not self.write_without_response)
                 await wait_for_ack(self.watcher.stage_three, "FRAME_ACK", self.log_notifications)
+                self._last_frame = frame
                 return
 
             except (asyncio.TimeoutError, BleakError, ConnectionError) as error:
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import os
+import string
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -8,7 +10,16 @@ FONTS_DIR = ASSETS_DIR / "fonts"
 FONT_EXTENSIONS = {".ttf", ".otf", ".ttc"}
 
 
+_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    "".join(chr(code) for code in range(128) if not chr(code).isalnum()),
+)
+
+
 def normalize(name: str) -> str:
+    if name.isascii():
+        return name.translate(_NORMALIZE_TABLE)
     return "".join(ch.lower() for ch in name if ch.isalnum())
 
 
@@ -30,19 +41,35 @@ FONT_PROFILES: dict[str, FontProfile] = {
 }
 
 
+_font_index_cache: Optional[tuple[int, dict[str, Path]]] = None
+
+
+def _font_index() -> dict[str, Path]:
+    """Map normalized font stems to files, rebuilt when FONTS_DIR changes."""
+    global _font_index_cache
+    try:
+        mtime = FONTS_DIR.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _font_index_cache is None or _font_index_cache[0] != mtime:
+        index: dict[str, Path] = {}
+        for entry in FONTS_DIR.iterdir():
+            if entry.suffix.lower() in FONT_EXTENSIONS:
+                index.setdefault(normalize(entry.stem), entry)
+        _font_index_cache = (mtime, index)
+    return _font_index_cache[1]
+
+
 def resolve_font(reference: Optional[str]) -> Optional[Path]:
     if not reference:
         return None
     candidate = Path(reference)
     if candidate.exists():
         return candidate
-    if not reference.lower().endswith(tuple(FONT_EXTENSIONS)) and FONTS_DIR.exists():
-        target = normalize(reference)
-        for entry in FONTS_DIR.iterdir():
-            if entry.suffix.lower() not in FONT_EXTENSIONS:
-                continue
-            if normalize(entry.stem) == target:
-                return entry
+    if candidate.suffix.lower() not in FONT_EXTENSIONS:
+        match = _font_index().get(normalize(reference))
+        if match is not None:
+            return match
     relative_candidate = ASSETS_DIR / reference
     if relative_candidate.exists():
         return relative_candidate
@@ -53,9 +80,11 @@ def list_available_fonts() -> list[str]:
     if not FONTS_DIR.exists():
         return []
     names: list[str] = []
-    for entry in FONTS_DIR.iterdir():
-        if entry.is_file() and entry.suffix.lower() in FONT_EXTENSIONS:
-            names.append(entry.stem)
+    with os.scandir(FONTS_DIR) as entries:
+        for entry in entries:
+            stem, suffix = os.path.splitext(entry.name)
+            if suffix.lower() in FONT_EXTENSIONS and entry.is_file():
+                names.append(stem)
     return sorted(names)
 
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
-from io import BytesIO
 from typing import List, Optional, Union
 from PIL import Image
 from .config import AppConfig, PanelDescriptor
-from .display_session import BleDisplaySession, adjust_image, build_frame
+from .display_session import BleDisplaySession, adjust_image_pil, build_frame
+
+try:
+    import imagequant
+except ImportError:
+    imagequant = None
 
 
 @dataclass
@@ -23,6 +27,9 @@ class PanelManager:
         self.tile_height = config.panels.tile_height
         self.columns = config.panels.columns if self.multi_panel else 1
         self.rows = config.panels.rows if self.multi_panel else 1
+        self._stream_queues: List[asyncio.Queue] = []
+        self._stream_workers: List[asyncio.Task] = []
+        self._tiles: tuple[tuple[BleDisplaySession, tuple[int, int, int, int]], ...] = ()
 
     @property
     def canvas_size(self) -> tuple[int, int]:
@@ -36,6 +43,12 @@ class PanelManager:
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
+        for worker in self._stream_workers:
+            worker.cancel()
+        await asyncio.gather(*self._stream_workers, return_exceptions=True)
+        self._stream_workers.clear()
+        self._stream_queues.clear()
+        self._tiles = ()
         while self.sessions:
             descriptor_session = self.sessions.pop()
             try:
@@ -57,6 +70,8 @@ class PanelManager:
             log_notifications=self.config.display.log_notifications,
             max_retries=self.config.display.max_retries,
             scan_timeout=self.config.device.scan_timeout,
+            palette_png=self.config.device.palette_png,
+            write_without_response=self.config.device.write_without_response,
         )
         await session.__aenter__()
         self.sessions.append(PanelSession(None, session))
@@ -76,40 +91,52 @@ class PanelManager:
                 log_notifications=self.config.display.log_notifications,
                 max_retries=self.config.display.max_retries,
                 scan_timeout=self.config.device.scan_timeout,
+                palette_png=self.config.device.palette_png,
+                write_without_response=self.config.device.write_without_response,
             )
             tasks.append(self._connect_panel(descriptor, session))
         await asyncio.gather(*tasks)
+        # Sessions land in connect-completion order; pair each with its crop box once.
+        self._tiles = tuple(
+            (panel_session.session, self._tile_box(panel_session.descriptor))
+            for panel_session in self.sessions
+            if panel_session.descriptor is not None
+        )
+
+    def _tile_box(self, descriptor: PanelDescriptor) -> tuple[int, int, int, int]:
+        left = descriptor.grid_x * self.tile_width
+        top = descriptor.grid_y * self.tile_height
+        return (left, top, left + self.tile_width, top + self.tile_height)
 
     async def _connect_panel(self, descriptor: PanelDescriptor, session: BleDisplaySession) -> None:
         await session.__aenter__()
         self.sessions.append(PanelSession(descriptor, session))
 
-    async def send_image(self, image: Image.Image, delay: float = 0.2) -> None:
+    async def send_image(self, image: Image.Image, delay: float = 0.0) -> None:
         if self.multi_panel:
             await self._send_multi(image, delay)
         else:
-            buffer = BytesIO()
-            image.save(buffer, format="PNG", optimize=False)
-            await self.sessions[0].session.send_png(buffer.getvalue(), delay)
+            await self.sessions[0].session.send_image(image, delay)
+
+    async def send_image_prechecked(self, image: Image.Image, delay: float = 0.0) -> None:
+        """Send an image already rendered at canvas_size, skipping the resize guard."""
+        if self.multi_panel:
+            await self._send_tiles(image, delay)
+        else:
+            await self.sessions[0].session.send_image(image, delay)
 
     async def _send_multi(self, image: Image.Image, delay: float) -> None:
         expected_width, expected_height = self.canvas_size
         if image.size != (expected_width, expected_height):
             image = image.resize((expected_width, expected_height))
-        tasks = []
-        for panel_session in self.sessions:
-            descriptor = panel_session.descriptor
-            if descriptor is None:
-                continue
-            left = descriptor.grid_x * self.tile_width
-            top = descriptor.grid_y * self.tile_height
-            right = left + self.tile_width
-            bottom = top + self.tile_height
-            region = image.crop((left, top, right, bottom))
-            buffer = BytesIO()
-            region.save(buffer, format="PNG", optimize=False)
-            tasks.append(panel_session.session.send_png(buffer.getvalue(), delay))
-        await asyncio.gather(*tasks)
+        await self._send_tiles(image, delay)
+
+    async def _send_tiles(self, image: Image.Image, delay: float) -> None:
+        # Pillow releases the GIL while encoding, so tiles encode side by side in worker threads.
+        frames = await asyncio.gather(
+            *(asyncio.to_thread(session.encode_image, image.crop(box)) for session, box in self._tiles)
+        )
+        await asyncio.gather(*(session.send_frame(frame, delay) for (session, _), frame in zip(self._tiles, frames)))
 
     def prebuffer_image(self, image: Image.Image) -> Union[bytes, List[bytes]]:
         """Pre-convert a PIL Image to ready-to-send frame bytes.
@@ -120,49 +147,38 @@ class PanelManager:
         if self.multi_panel:
             return self._prebuffer_multi(image)
         else:
-            png_bytes = self._compress_png(image)
-            session = self.sessions[0].session
-            processed = adjust_image(png_bytes, session.rotation, session.brightness)
-            return build_frame(processed)
+            return self._compress_frame(image, self.sessions[0].session)
 
-    def _compress_png(self, image: Image.Image) -> bytes:
-        """Compress image to PNG with optimal settings for BLE transfer."""
+    def _compress_frame(self, image: Image.Image, session: BleDisplaySession) -> bytes:
+        """Quantize, transform and encode an image once, with optimal settings for BLE transfer."""
         # Convert to RGB if needed (remove alpha for smaller size)
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        # Reduce colors for smaller PNG (quantize to 64 colors)
-        image = image.quantize(colors=64, method=Image.Quantize.FASTOCTREE).convert("RGB")
+        # Reduce colors for smaller PNG (quantize to 64 colors); libimagequant picks a better palette
+        if imagequant is not None:
+            image = imagequant.quantize_pil_image(image, dithering_level=0.0, max_colors=64)
+        else:
+            image = image.quantize(colors=64, method=Image.Quantize.FASTOCTREE)
+        if not session.palette_png:
+            image = image.convert("RGB")
 
-        buffer = BytesIO()
-        image.save(buffer, format="PNG", optimize=True, compress_level=9)
-        return buffer.getvalue()
+        processed = adjust_image_pil(
+            image, session.rotation, session.brightness, optimize=True, palette=session.palette_png
+        )
+        return build_frame(processed)
 
     def _prebuffer_multi(self, image: Image.Image) -> List[bytes]:
         expected_width, expected_height = self.canvas_size
         if image.size != (expected_width, expected_height):
             image = image.resize((expected_width, expected_height))
-        frames = []
-        for panel_session in self.sessions:
-            descriptor = panel_session.descriptor
-            if descriptor is None:
-                continue
-            left = descriptor.grid_x * self.tile_width
-            top = descriptor.grid_y * self.tile_height
-            right = left + self.tile_width
-            bottom = top + self.tile_height
-            region = image.crop((left, top, right, bottom))
-            png_bytes = self._compress_png(region)
-            session = panel_session.session
-            processed = adjust_image(png_bytes, session.rotation, session.brightness)
-            frames.append(build_frame(processed))
-        return frames
+        return [self._compress_frame(image.crop(box), session) for session, box in self._tiles]
 
     def prebuffer_images(self, images: List[Image.Image]) -> List[Union[bytes, List[bytes]]]:
         """Pre-convert a list of PIL Images to ready-to-send frame bytes."""
         return [self.prebuffer_image(img) for img in images]
 
-    async def send_prebuffered(self, frame_data: Union[bytes, List[bytes]], delay: float = 0.2) -> None:
+    async def send_prebuffered(self, frame_data: Union[bytes, List[bytes]], delay: float = 0.0) -> None:
         """Send pre-buffered frame data without any conversion."""
         if self.multi_panel:
             tasks = []
@@ -177,12 +193,36 @@ class PanelManager:
     async def send_prebuffered_streaming(self, frame_data: Union[bytes, List[bytes]]) -> None:
         """Send pre-buffered frame with minimum latency for streaming."""
         if self.multi_panel:
-            tasks = []
-            for i, panel_session in enumerate(self.sessions):
-                if panel_session.descriptor is None:
-                    continue
-                tasks.append(panel_session.session.send_frame_streaming(frame_data[i]))
-            await asyncio.gather(*tasks)
+            if not self._stream_workers:
+                self._start_stream_workers()
+            loop = asyncio.get_running_loop()
+            pending = []
+            for queue, frame in zip(self._stream_queues, frame_data):
+                done = loop.create_future()
+                queue.put_nowait((frame, done))
+                pending.append(done)
+            await asyncio.gather(*pending)
         else:
             await self.sessions[0].session.send_frame_streaming(frame_data)
 
+    def _start_stream_workers(self) -> None:
+        """Start one long-lived sender per panel so streaming does not spawn tasks per frame."""
+        for panel_session in self.sessions:
+            if panel_session.descriptor is None:
+                continue
+            queue: asyncio.Queue = asyncio.Queue()
+            self._stream_queues.append(queue)
+            self._stream_workers.append(asyncio.create_task(self._stream_worker(panel_session.session, queue)))
+
+    @staticmethod
+    async def _stream_worker(session: BleDisplaySession, queue: asyncio.Queue) -> None:
+        while True:
+            frame, done = await queue.get()
+            try:
+                await session.send_frame_streaming(frame)
+            except Exception as error:
+                if not done.done():
+                    done.set_exception(error)
+            else:
+                if not done.done():
+                    done.set_result(None)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 
 
+@lru_cache(maxsize=16)
 def load_font(path: Optional[Path], size: int) -> ImageFont.ImageFont:
     if path is None:
         return ImageFont.load_default()
@@ -14,44 +16,33 @@ def load_font(path: Optional[Path], size: int) -> ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
-def build_text_bitmap(
-    text: str,
-    font_path: Optional[Path],
-    size: int,
-    spacing: int,
-    color: tuple[int, int, int],
-    antialias: bool,
-    monospace_digits: bool = True,
-) -> Image.Image:
-    font = load_font(font_path, size)
-    formatted = text.replace("\\n", "\n")
-    lines = formatted.split("\n")
-    mask_mode = "L" if antialias else "1"
-    dummy = Image.new(mask_mode, (1, 1), 0)
-    draw_dummy = ImageDraw.Draw(dummy)
-    has_length = hasattr(font, "getlength")
+@lru_cache(maxsize=2)
+def _measure_draw(antialias: bool) -> ImageDraw.ImageDraw:
+    return ImageDraw.Draw(Image.new("L" if antialias else "1", (1, 1), 0))
+
+
+def _advance_width(font: ImageFont.ImageFont, draw_dummy: ImageDraw.ImageDraw, char: str) -> float:
+    if hasattr(font, "getlength"):
+        value = font.getlength(char)
+        if value > 0:
+            return value
+    width = draw_dummy.textlength(char, font=font)
+    return float(width if width > 0 else 1)
 
-    def advance_width(char: str) -> float:
-        if has_length:
-            value = font.getlength(char)
-            if value > 0:
-                return value
-        width = draw_dummy.textlength(char, font=font)
-        return float(width if width > 0 else 1)
 
-    digit_data = {}
-    max_digit_advance = 0.0
-    digit_top = 0
-    digit_bottom = 0
+@lru_cache(maxsize=16)
+def _font_metrics(
+    font_path: Optional[Path], size: int, antialias: bool
+) -> tuple[dict[str, float], float, int, int]:
+    """Digit advances, widest digit advance, ascent and descent for a font."""
+    font = load_font(font_path, size)
+    draw_dummy = _measure_draw(antialias)
+    digit_advances: dict[str, float] = {}
     for digit in "0123456789":
-        bbox = draw_dummy.textbbox((0, 0), digit, font=font)
-        if bbox is None:
+        if draw_dummy.textbbox((0, 0), digit, font=font) is None:
             continue
-        adv = advance_width(digit)
-        digit_data[digit] = (bbox, adv)
-        max_digit_advance = max(max_digit_advance, adv)
-        digit_top = min(digit_top, bbox[1])
-        digit_bottom = max(digit_bottom, bbox[3])
+        digit_advances[digit] = _advance_width(font, draw_dummy, digit)
+    max_digit_advance = max(digit_advances.values(), default=0.0)
     ascent = descent = 0
     if hasattr(font, "getmetrics"):
         ascent, descent = font.getmetrics()
@@ -60,6 +51,50 @@ def build_text_bitmap(
         if sample_bbox:
             ascent = max(ascent, -sample_bbox[1])
             descent = max(descent, sample_bbox[3])
+    return digit_advances, max_digit_advance, ascent, descent
+
+
+@lru_cache(maxsize=512)
+def _render_glyph(
+    font_path: Optional[Path],
+    size: int,
+    char: str,
+    color: tuple[int, int, int],
+    antialias: bool,
+) -> Optional[tuple[Image.Image, tuple[int, int, int, int], float]]:
+    """Rasterize one character once; counters and scrollers reuse the same few glyphs."""
+    font = load_font(font_path, size)
+    draw_dummy = _measure_draw(antialias)
+    bbox = draw_dummy.textbbox((0, 0), char, font=font)
+    if bbox is None:
+        return None
+    mask_mode = "L" if antialias else "1"
+    width = max(1, bbox[2] - bbox[0])
+    height = max(1, bbox[3] - bbox[1])
+    mask = Image.new(mask_mode, (width, height), 0)
+    draw_mask = ImageDraw.Draw(mask)
+    draw_mask.text((-bbox[0], -bbox[1]), char, fill=255, font=font)
+    if not antialias:
+        mask = mask.convert("L")
+    glyph = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    fill_layer = Image.new("RGBA", (width, height), (*color, 255))
+    glyph = Image.composite(fill_layer, glyph, mask)
+    return glyph, bbox, _advance_width(font, draw_dummy, char)
+
+
+def build_text_bitmap(
+    text: str,
+    font_path: Optional[Path],
+    size: int,
+    spacing: int,
+    color: tuple[int, int, int],
+    antialias: bool,
+    monospace_digits: bool = True,
+) -> Image.Image:
+    color = tuple(color)
+    formatted = text.replace("\\n", "\n")
+    lines = formatted.split("\n")
+    digit_advances, max_digit_advance, ascent, descent = _font_metrics(font_path, size, antialias)
     line_height = ascent + descent if ascent + descent > 0 else size
     placements: list[tuple[Image.Image, float, float]] = []
     min_x = math.inf
@@ -70,22 +105,13 @@ def build_text_bitmap(
         cursor_x = 0.0
         baseline = index * (line_height + spacing) + ascent
         for char in line:
-            bbox = draw_dummy.textbbox((0, 0), char, font=font)
-            if bbox is None:
+            rendered = _render_glyph(font_path, size, char, color, antialias)
+            if rendered is None:
                 continue
-            width = max(1, bbox[2] - bbox[0])
-            height = max(1, bbox[3] - bbox[1])
-            mask = Image.new(mask_mode, (width, height), 0)
-            draw_mask = ImageDraw.Draw(mask)
-            draw_mask.text((-bbox[0], -bbox[1]), char, fill=255, font=font)
-            if not antialias:
-                mask = mask.convert("L")
-            glyph = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-            fill_layer = Image.new("RGBA", (width, height), (*color, 255))
-            glyph = Image.composite(fill_layer, glyph, mask)
-            advance = advance_width(char)
+            glyph, bbox, advance = rendered
+            width, height = glyph.size
             adjust = 0.0
-            if monospace_digits and char in digit_data and max_digit_advance > 0:
+            if monospace_digits and char in digit_advances and max_digit_advance > 0:
                 adjust = 0.5 * (max_digit_advance - advance)
                 advance = max_digit_advance
             x = cursor_x + adjust + bbox[0]
@@ -12,6 +12,11 @@ except ImportError:
     print("Install with: pip install websockets")
     sys.exit(1)
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
@@ -19,6 +24,14 @@ if str(project_root) not in sys.path:
 from bk_light.display_session import BleDisplaySession, build_frame
 
 MIN_FRAME_INTERVAL = 0.08
+INDEX_HTML = b"<!DOCTYPE html><html><head><title>BLE Panel Server</title></head><body><h1>BLE Panel Server</h1><p>Server is running. Connect via WebSocket to send frames.</p></body></html>"
+INDEX_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html; charset=utf-8\r\n"
+    b"Content-Length: " + str(len(INDEX_HTML)).encode() + b"\r\n"
+    b"Connection: close\r\n\r\n" + INDEX_HTML
+)
+NOT_FOUND_RESPONSE = b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\nNot found"
 
 panel_address = None
 panel = None
@@ -30,7 +43,7 @@ def is_valid_png(data: bytes) -> bool:
 
 
 async def handle_websocket(websocket):
-    global panel, last_frame_time
+    global panel
     print(f"Client connected: {websocket.remote_address}")
     
     if not panel:
@@ -47,61 +60,65 @@ async def handle_websocket(websocket):
             await websocket.close()
             return
     
+    latest: list[bytes] = []
+    ready = asyncio.Event()
+    sender = asyncio.create_task(send_latest(latest, ready))
     try:
         async for message in websocket:
             if not isinstance(message, bytes) or not panel:
                 continue
             if not is_valid_png(message):
                 continue
-            now = asyncio.get_event_loop().time()
-            if now - last_frame_time >= MIN_FRAME_INTERVAL:
-                last_frame_time = now
-                try:
-                    frame = build_frame(message)
-                    await panel.send_frame(frame, delay=0.1)
-                except Exception as e:
-                    print(f"Error sending frame: {e}")
-                    if "not connected" in str(e).lower() or "disconnected" in str(e).lower():
-                        try:
-                            await panel._connect()
-                        except:
-                            pass
+            # Latest wins: a frame still waiting for the panel is replaced, not queued
+            latest[:] = [message]
+            ready.set()
     except websockets.exceptions.ConnectionClosed:
         pass
     except Exception as e:
         print(f"WebSocket error: {e}")
     finally:
+        sender.cancel()
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
         if panel:
             await panel._safe_disconnect()
             panel = None
         print(f"Client disconnected: {websocket.remote_address}")
 
 
+async def send_latest(latest: list[bytes], ready: asyncio.Event) -> None:
+    global last_frame_time
+    loop = asyncio.get_running_loop()
+    while True:
+        await ready.wait()
+        wait = MIN_FRAME_INTERVAL - (loop.time() - last_frame_time)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        ready.clear()
+        message = latest.pop()
+        last_frame_time = loop.time()
+        try:
+            frame = build_frame(message)
+            await panel.send_frame(frame, delay=0.1)
+        except Exception as e:
+            print(f"Error sending frame: {e}")
+            if "not connected" in str(e).lower() or "disconnected" in str(e).lower():
+                try:
+                    await panel._connect()
+                except:
+                    pass
+
+
 async def handle_http(reader, writer):
     try:
         data = await reader.read(4096)
-        request = data.decode("utf-8", errors="ignore")
-
-        path = None
-        for line in request.split("\n"):
-            if line.startswith("GET "):
-                parts = line.split()
-                if len(parts) >= 2:
-                    path = parts[1]
-                break
-
-        if path == "/":
-            content = b"<!DOCTYPE html><html><head><title>BLE Panel Server</title></head><body><h1>BLE Panel Server</h1><p>Server is running. Connect via WebSocket to send frames.</p></body></html>"
-            response = (
-                b"HTTP/1.1 200 OK\r\n"
-                b"Content-Type: text/html; charset=utf-8\r\n"
-                b"Content-Length: " + str(len(content)).encode() + b"\r\n"
-                b"Connection: close\r\n\r\n" + content
-            )
-        else:
-            response = b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\nNot found"
-
-        writer.write(response)
+        # Only the request line matters; parse it as bytes without decoding the headers
+        parts = data.partition(b"\n")[0].split()
+        path = parts[1] if len(parts) >= 2 and parts[0] == b"GET" else None
+
+        writer.write(INDEX_RESPONSE if path == b"/" else NOT_FOUND_RESPONSE)
         await writer.drain()
     except Exception as e:
         print(f"HTTP error: {e}")
@@ -126,7 +143,8 @@ async def main():
         http_server = await asyncio.start_server(handle_http, "0.0.0.0", args.port)
         print(f"HTTP: http://localhost:{args.port}/")
 
-        ws_server = await websockets.serve(handle_websocket, "0.0.0.0", args.ws_port)
+        # Frames are PNG, already deflated; permessage-deflate would only add an inflate copy per message
+        ws_server = await websockets.serve(handle_websocket, "0.0.0.0", args.ws_port, compression=None)
         print(f"WebSocket: ws://localhost:{args.ws_port}/")
         print("Waiting for WebSocket client... (panel will connect on first client)")
 
@@ -142,7 +160,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop trims per-callback overhead; limited to Linux, where bleak's D-Bus backend runs on it
+    run = uvloop.run if uvloop is not None and sys.platform.startswith("linux") else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\nStopped")
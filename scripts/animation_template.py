@@ -1,13 +1,15 @@
 """Animation template for LED matrix.
 
-Copy this file and modify generate_frame() to create new animations.
+Copy this file and modify render_frame() to create new animations.
 """
 
 import argparse
 import asyncio
+import ctypes
 import os
 import sys
 from dataclasses import replace
+from functools import lru_cache, wraps
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -26,39 +28,62 @@ from bk_light.panel_manager import PanelManager
 
 SCRIPT_NAME = "Animation Template"
 DEFAULT_FPS = 2  # BLE device limit
+PACING_SPIN = 0.002  # Final stretch before a frame deadline spent yielding instead of sleeping
 
 
 # =============================================================================
 # ANIMATION - MODIFY THIS SECTION
 # =============================================================================
 
-def generate_frame(
-    width: int,
-    height: int,
+def rainbow_rgb_numpy(np, width: int, height: int, t: float):
+    """Vectorized version of the example rainbow in render_frame()."""
+    xs = np.arange(width) / width
+    ys = np.arange(height)[:, None] / height
+    hue = (xs + ys + t) % 1.0
+
+    # Convert HSV to RGB for every pixel at once
+    h = hue * 6
+    c = np.ones_like(h)
+    x_val = c * (1 - np.abs(h % 2 - 1))
+    zero = np.zeros_like(h)
+    sectors = [h < 1, h < 2, h < 3, h < 4, h < 5]
+    r = np.select(sectors, [c, x_val, zero, zero, x_val], c)
+    g = np.select(sectors, [x_val, c, c, x_val, zero], zero)
+    b = np.select(sectors, [zero, zero, x_val, c, c], x_val)
+
+    return (np.stack([r, g, b], axis=-1) * 255).astype(np.uint8)
+
+
+def render_frame(
+    image: Image.Image,
     t: float,
     **kwargs,
-) -> Image.Image:
-    """Generate a single animation frame.
+) -> None:
+    """Draw a single animation frame into image, in place.
 
     Args:
-        width: Frame width in pixels
-        height: Frame height in pixels
+        image: RGB frame to overwrite (reused between frames, so paint every pixel)
         t: Time parameter (increments by 'speed' each frame)
         **kwargs: Additional parameters from command line
-
-    Returns:
-        PIL Image (RGB mode)
     """
-    # Create blank frame
-    image = Image.new('RGB', (width, height), (0, 0, 0))
-    pixels = image.load()
-
     # =================================================================
     # YOUR ANIMATION CODE HERE
     # Example: simple color gradient that shifts over time
     # =================================================================
+    width, height = image.size
 
-    import math
+    # Whole-frame NumPy math is far faster than a per-pixel Python loop.
+    # numpy is optional and imported lazily (see fft_vu_meter.py), so the
+    # loop below stays as the fallback and as the readable reference.
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        image.frombytes(rainbow_rgb_numpy(np, width, height, t).tobytes())
+        return
+
+    pixels = image.load()
 
     for y in range(height):
         for x in range(width):
@@ -85,6 +110,11 @@ def generate_frame(
 
             pixels[x, y] = (int(r * 255), int(g * 255), int(b * 255))
 
+
+def generate_frame(width: int, height: int, t: float, **kwargs) -> Image.Image:
+    """Return render_frame() drawn into a fresh image (for callers that keep frames)."""
+    image = Image.new('RGB', (width, height))
+    render_frame(image, t, **kwargs)
     return image
 
 
@@ -98,42 +128,160 @@ def add_custom_args(parser: argparse.ArgumentParser) -> None:
     pass  # Add your custom arguments here
 
 
+# =============================================================================
+# NUMBA (OPTIONAL) - DO NOT MODIFY
+# =============================================================================
+
+def numba_frame(pixel):
+    """Turn a per-pixel ``pixel(x, y, t, width, height, *params) -> (r, g, b)`` into a generate_frame().
+
+    The function is JIT-compiled with numba on first use and called for every
+    pixel with rows spread across CPU cores; pass the result to
+    run_animation(generate=...). ``params`` are the custom argument values, in
+    the order add_custom_args() adds them. Requires numba (pip install numba).
+    The pixel function is cached on disk; the row loop around it is compiled
+    again at each launch, which delays the first frame.
+    """
+    @lru_cache(maxsize=1)
+    def compiled_kernel():
+        # Lazy import, like numpy (see render_frame)
+        import numba
+
+        compiled_pixel = numba.njit(cache=True, fastmath=True)(pixel)
+
+        def kernel(buf, t, width, height, params):
+            for y in numba.prange(height):
+                for x in range(width):
+                    r, g, b = compiled_pixel(x, y, t, width, height, *params)
+                    buf[y, x, 0] = r
+                    buf[y, x, 1] = g
+                    buf[y, x, 2] = b
+
+        # No cache=True: kernel closes over compiled_pixel, so numba can't reuse a cached
+        # copy and would only write a new file each run
+        return numba.njit(parallel=True, fastmath=True)(kernel)
+
+    @wraps(pixel)
+    def generate_frame(width: int, height: int, t: float, **kwargs) -> Image.Image:
+        import numpy as np
+
+        # A fresh buffer per frame: run_animation may still be sending the previous one
+        buf = np.empty((height, width, 3), dtype=np.uint8)
+        compiled_kernel()(buf, t, width, height, tuple(kwargs.values()))
+        return Image.frombuffer('RGB', (width, height), buf, 'raw', 'RGB', 0, 1)  # Zero-copy view of buf
+
+    return generate_frame
+
+
 # =============================================================================
 # CONSOLE PREVIEW - DO NOT MODIFY
 # =============================================================================
 
-def print_console_preview(image: Image.Image, title: str = "") -> None:
-    """Print a dot-matrix preview to console with colors."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    if title:
-        print(title + "\n")
+PREVIEW_BLOCK = "▀"  # Foreground paints the top pixel, background the one below
+# A fully black cell is a plain space on the terminal background; only the first
+# of a run needs the reset (see preview_rows), so dark areas cost one byte a cell
+PREVIEW_DARK = "\033[0m "
+PREVIEW_DARK_REPEAT = " \033[0m"  # Dark cell right after another: drop its reset
+# 256-color terminal: 6x6x6 cube level (0-5) of every 0-255 channel value
+PREVIEW_LEVELS = tuple(value * 5 // 255 for value in range(256))
+
+
+@lru_cache(maxsize=1)
+def preview_cells() -> list[list[str]]:
+    """Escape + half block for every (top, bottom) color cube pair, built once instead of per cell."""
+    cells = [
+        [f"\033[38;5;{16 + top};48;5;{16 + bottom}m{PREVIEW_BLOCK}" for bottom in range(216)]
+        for top in range(216)
+    ]
+    cells[0][0] = PREVIEW_DARK
+    return cells
+
+
+@lru_cache(maxsize=1)
+def preview_cell_table(np):
+    """preview_cells() as a (216, 216) object array, so a whole frame maps in one gather."""
+    table = np.empty((216, 216), dtype=object)
+    table[:] = preview_cells()
+    return table
+
+
+@lru_cache(maxsize=1)
+def preview_cube_lut(np):
+    """PREVIEW_LEVELS pre-weighted per channel (36, 6, 1), for one take() per channel."""
+    levels = np.array(PREVIEW_LEVELS, dtype=np.int32)
+    return levels * 36, levels * 6, levels
+
+
+def preview_rows(image: Image.Image) -> list[str]:
+    """One string of preview_cells() per pair of pixel rows.
+
+    Each cell shows two vertically stacked pixels; an odd last row is doubled.
+    """
+    # numpy is optional and imported lazily (see render_frame)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        arr = np.asarray(image, dtype=np.int32)
+        red, green, blue = preview_cube_lut(np)
+        cubes = red.take(arr[..., 0]) + green.take(arr[..., 1]) + blue.take(arr[..., 2])
+        if len(cubes) % 2:
+            cubes = np.vstack([cubes, cubes[-1:]])
+        rows = ["".join(row) for row in preview_cell_table(np)[cubes[0::2], cubes[1::2]].tolist()]
+        return [row.replace(PREVIEW_DARK_REPEAT, " ") for row in rows]
 
     width, height = image.size
     pixels = image.load()
-    RESET = "\033[0m"
-
+    cube_rows = []
     for y in range(height):
-        line = ""
+        cube_row = []
         for x in range(width):
             r, g, b = pixels[x, y]
-            brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
+            cube_row.append(36 * PREVIEW_LEVELS[r] + 6 * PREVIEW_LEVELS[g] + PREVIEW_LEVELS[b])
+        cube_rows.append(cube_row)
+    if height % 2:
+        cube_rows.append(cube_rows[-1])
+    cells = preview_cells()
+    return [
+        "".join([cells[top][bottom] for top, bottom in zip(tops, bottoms)]).replace(PREVIEW_DARK_REPEAT, " ")
+        for tops, bottoms in zip(cube_rows[0::2], cube_rows[1::2])
+    ]
 
-            if brightness < 0.1:
-                dot = " "
-            elif brightness < 0.4:
-                dot = "•"
-            else:
-                dot = "●"
 
-            # 256-color terminal
-            r_term = int(r / 255 * 5)
-            g_term = int(g / 255 * 5)
-            b_term = int(b / 255 * 5)
-            color_code = 16 + 36 * r_term + 6 * g_term + b_term
-            line += f"\033[38;5;{color_code}m{dot} "
+def print_console_preview(image: Image.Image, title: str = "") -> None:
+    """Print a half-block color preview to console (two pixel rows per text row)."""
+    RESET = "\033[0m"
 
-        print(line + RESET)
-    print()
+    # Build the whole frame and write it once: one flush instead of one per row.
+    # Cursor-home and overdraw instead of spawning cls/clear every frame.
+    out = ["\033[H"]
+    if title:
+        out.append(title + "\033[K\n\n")
+    for row in preview_rows(image):
+        out.append(row)
+        out.append(RESET + "\n")
+    out.append("\n\033[J")  # Erase whatever the previous frame left below
+    text = "".join(out)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. an IDE console that replaced stdout
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    # Encode once and hand raw bytes to the OS, bypassing the text layer
+    sys.stdout.flush()  # Keep ordering with anything print()ed before
+    buffer.write(text.encode(sys.stdout.encoding or "utf-8", "replace"))
+    buffer.flush()
+
+
+@lru_cache(maxsize=4)
+def debug_font(size: int) -> ImageFont.ImageFont:
+    """Load the overlay font once instead of re-parsing it every frame."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
 
 
 def draw_debug_overlay(image: Image.Image, frame_count: int) -> None:
@@ -142,24 +290,13 @@ def draw_debug_overlay(image: Image.Image, frame_count: int) -> None:
     draw = ImageDraw.Draw(image)
     text = str(frame_count)
 
-    try:
-        font = ImageFont.truetype("arial.ttf", 16)
-    except OSError:
-        font = ImageFont.load_default()
-
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) // 2
-    y = (height - text_height) // 2
+    font = debug_font(16)
 
-    # Black outline
-    for dx in [-1, 0, 1]:
-        for dy in [-1, 0, 1]:
-            if dx != 0 or dy != 0:
-                draw.text((x + dx, y + dy), text, fill=(0, 0, 0), font=font)
-    # White text
-    draw.text((x, y), text, fill=(255, 255, 255), font=font)
+    # White text with a black outline, stroked in one pass and centered by anchor (no bbox measuring)
+    draw.text(
+        (width // 2, height // 2), text,
+        fill=(255, 255, 255), font=font, stroke_width=1, stroke_fill=(0, 0, 0), anchor="mm",
+    )
 
 
 # =============================================================================
@@ -172,9 +309,19 @@ async def run_animation(
     no_device: bool = False,
     fps: float = DEFAULT_FPS,
     debug: bool = False,
+    generate=None,
+    preview=None,
     **kwargs,
 ) -> None:
-    """Main animation loop."""
+    """Main animation loop.
+
+    Frames are drawn by render_frame() into reused buffers; ``generate``
+    (a generate_frame()-style function returning a new image) replaces it,
+    so variants can reuse this loop.
+    ``preview`` forces the console preview on or off; by default it is shown
+    only when stdout is a terminal (always with --no-device).
+    """
+    show_preview = preview if preview is not None else (no_device or sys.stdout.isatty())
     if no_device:
         width, height = 32, 32
         manager = None
@@ -183,19 +330,41 @@ async def run_animation(
         await manager.__aenter__()
         width, height = manager.canvas_size
 
-    print(f"\033[?25l", end="")  # Hide cursor
+    if show_preview:
+        if os.name == 'nt':
+            os.system('')  # Enables ANSI escape handling in the Windows console
+        sys.stdout.write("\033[2J\033[H")  # Clear once; previews then redraw in place
+        print(f"\033[?25l", end="")  # Hide cursor
+
+    # The sender encodes (or crops) a frame as soon as it dequeues it, so only the
+    # queued frame must stay untouched: two buffers, alternating, are enough.
+    buffers = [Image.new('RGB', (width, height)) for _ in range(2)]
+
+    if os.name == 'nt':
+        ctypes.windll.winmm.timeBeginPeriod(1)  # 1 ms timer resolution instead of ~15.6 ms
 
     t = 0.0
     frame_interval = 1.0 / fps
     frame_count = 0
-    start_time = asyncio.get_event_loop().time()
+    now = asyncio.get_running_loop().time  # Bound once: called several times per frame
+    sleep = asyncio.sleep
+    start_time = now()
+    deadline = start_time
+
+    # BLE sends run in their own task so generation and preview never wait on the panel
+    frames: asyncio.Queue = asyncio.Queue(maxsize=1)
+    sender = asyncio.create_task(send_frames(manager, frames, debug)) if manager else None
 
     try:
         while True:
-            frame_start = asyncio.get_event_loop().time()
+            frame_start = now()
 
             # Generate frame
-            frame = generate_frame(width, height, t, **kwargs)
+            if generate is None:
+                frame = buffers[frame_count % 2]
+                render_frame(frame, t, **kwargs)
+            else:
+                frame = generate(width, height, t, **kwargs)
 
             # Debug overlay
             if debug:
@@ -205,42 +374,71 @@ async def run_animation(
             else:
                 title = f"{SCRIPT_NAME} - {width}x{height} - Ctrl+C to exit"
 
-            # Console preview
-            print_console_preview(frame, title)
+            # Console preview (skipped when nobody is watching the terminal)
+            if show_preview:
+                print_console_preview(frame, title)
 
             # Send to device
-            if manager:
-                send_start = asyncio.get_event_loop().time()
-                await manager.send_image(frame, delay=0.01)
-                if debug:
-                    send_time = asyncio.get_event_loop().time() - send_start
-                    print(f"Frame {frame_count} sent in {send_time*1000:.0f}ms")
+            if sender:
+                if sender.done():
+                    sender.result()  # Surface a send failure instead of animating into the void
+                if frames.full():
+                    frames.get_nowait()  # Panel is behind: replace the stale frame with this one
+                frames.put_nowait((frame_count, frame))
 
             frame_count += 1
             t += speed
 
-            # Maintain target FPS
-            elapsed = asyncio.get_event_loop().time() - frame_start
-            sleep_time = max(0, frame_interval - elapsed)
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+            # Maintain target FPS against absolute deadlines, so an overrun doesn't shift every later frame
+            deadline += frame_interval
+            sleep_time = deadline - now()
+            if sleep_time < -frame_interval:
+                deadline = now()  # Resync after a long stall instead of bursting to catch up
+            # Sleep most of the gap, then yield until the deadline: timer sleeps overshoot by
+            # up to the OS tick. Always yield at least once so the sender and Ctrl+C still run.
+            if sleep_time > PACING_SPIN:
+                await sleep(sleep_time - PACING_SPIN)
+            await sleep(0)
+            while now() < deadline:
+                await sleep(0)
 
     except asyncio.CancelledError:
         pass
     finally:
+        if os.name == 'nt':
+            ctypes.windll.winmm.timeEndPeriod(1)
         print(f"\033[?25h", end="")  # Show cursor
         if debug:
-            total_time = asyncio.get_event_loop().time() - start_time
+            total_time = now() - start_time
             print(f"\nTotal: {frame_count} frames in {total_time:.1f}s ({frame_count/total_time:.1f} FPS)")
+        if sender:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
         if manager:
             await manager.__aexit__(None, None, None)
 
 
+async def send_frames(manager: PanelManager, frames: asyncio.Queue, debug: bool) -> None:
+    """Send queued (frame_count, frame) pairs to the device, newest only."""
+    loop = asyncio.get_running_loop()
+    while True:
+        frame_count, frame = await frames.get()
+        send_start = loop.time()
+        await manager.send_image(frame, delay=0.01)
+        if debug:
+            send_time = loop.time() - send_start
+            print(f"Frame {frame_count} sent in {send_time*1000:.0f}ms")
+
+
 # =============================================================================
 # ARGUMENT PARSING - DO NOT MODIFY (except add_custom_args)
 # =============================================================================
 
-def parse_args() -> argparse.Namespace:
+def parse_args(add_args=add_custom_args) -> tuple[argparse.Namespace, dict]:
+    """Parse the command line; returns the args and the custom ones as kwargs.
+
+    ``add_args`` adds the custom arguments, so variants pass their own add_custom_args.
+    """
     parser = argparse.ArgumentParser(description=SCRIPT_NAME)
 
     # Standard arguments
@@ -262,11 +460,18 @@ def parse_args() -> argparse.Namespace:
         "--debug", action="store_true",
         help="Show debug info (frame count, send time, actual FPS)"
     )
+    parser.add_argument(
+        "--preview", action=argparse.BooleanOptionalAction, default=None,
+        help="Force the console preview on/off (default: on when stdout is a terminal)"
+    )
 
-    # Custom arguments for this animation
-    add_custom_args(parser)
+    # Custom arguments for this animation: whatever add_args adds beyond the standard ones
+    standard_names = set(vars(parser.parse_args([])))
+    add_args(parser)
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    custom_kwargs = {name: value for name, value in vars(args).items() if name not in standard_names}
+    return args, custom_kwargs
 
 
 # =============================================================================
@@ -274,7 +479,7 @@ def parse_args() -> argparse.Namespace:
 # =============================================================================
 
 if __name__ == "__main__":
-    args = parse_args()
+    args, custom_kwargs = parse_args()
 
     config = None
     if not args.no_device:
@@ -282,10 +487,6 @@ if __name__ == "__main__":
         if args.address:
             config = replace(config, device=replace(config.device, address=args.address))
 
-    # Extract custom kwargs (exclude standard args)
-    standard_args = {'config', 'address', 'speed', 'fps', 'no_device', 'debug'}
-    custom_kwargs = {k: v for k, v in vars(args).items() if k not in standard_args}
-
     try:
         asyncio.run(run_animation(
             config,
@@ -293,6 +494,7 @@ if __name__ == "__main__":
             no_device=args.no_device,
             fps=args.fps,
             debug=args.debug,
+            preview=args.preview,
             **custom_kwargs,
         ))
     except KeyboardInterrupt:
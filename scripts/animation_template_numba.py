@@ -0,0 +1,104 @@
+"""Numba variant of animation_template.py.
+
+Use this when per-pixel logic can't be written as whole-array NumPy math:
+modify generate_frame(); @numba_frame JIT-compiles it and spreads the
+pixels across CPU cores.
+Requires numba (pip install numba).
+"""
+
+import argparse
+import asyncio
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+# Note: numpy and numba are imported lazily to avoid COM conflicts with bleak on Windows
+
+from bk_light.config import load_config
+from scripts.animation_template import numba_frame, parse_args, run_animation
+
+
+# =============================================================================
+# ANIMATION - MODIFY THIS SECTION
+# =============================================================================
+
+@numba_frame
+def generate_frame(x, y, t, width, height):
+    """Color of pixel (x, y) at time t, as (r, g, b) integers 0-255.
+
+    Plain scalar Python: numba compiles it and calls it for every pixel.
+    Custom arguments follow height as extra parameters, in the order
+    add_custom_args() adds them (e.g. ``def generate_frame(x, y, t, width, height, intensity)``).
+    """
+    # Example: shifting rainbow pattern (same as animation_template.py)
+    hue = (x / width + y / height + t) % 1.0
+
+    h = hue * 6
+    c = 1.0
+    x_val = c * (1 - abs(h % 2 - 1))
+
+    if h < 1:
+        r, g, b = c, x_val, 0.0
+    elif h < 2:
+        r, g, b = x_val, c, 0.0
+    elif h < 3:
+        r, g, b = 0.0, c, x_val
+    elif h < 4:
+        r, g, b = 0.0, x_val, c
+    elif h < 5:
+        r, g, b = x_val, 0.0, c
+    else:
+        r, g, b = c, 0.0, x_val
+
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+def add_custom_args(parser: argparse.ArgumentParser) -> None:
+    """Add custom command line arguments for this animation.
+
+    Their values are passed to generate_frame() after height, so keep them
+    numeric (numba compiles them).
+
+    Example:
+        parser.add_argument("--intensity", type=float, default=1.0)
+    """
+    pass  # Add your custom arguments here
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+if __name__ == "__main__":
+    args, custom_kwargs = parse_args(add_custom_args)
+
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        print("Error: numba is required. Install with: pip install numba")
+        sys.exit(1)
+
+    config = None
+    if not args.no_device:
+        config = load_config(args.config)
+        if args.address:
+            config = replace(config, device=replace(config.device, address=args.address))
+
+    try:
+        asyncio.run(run_animation(
+            config,
+            speed=args.speed,
+            no_device=args.no_device,
+            fps=args.fps,
+            debug=args.debug,
+            preview=args.preview,
+            generate=generate_frame,
+            **custom_kwargs,
+        ))
+    except KeyboardInterrupt:
+        print("\033[?25h", end="")  # Show cursor
+        print("\nDone.")
@@ -5,7 +5,9 @@ import asyncio
 import os
 import sys
 from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from PIL import Image
 
@@ -13,6 +15,8 @@ project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
+# Note: numpy is optional and imported lazily to avoid COM conflicts with bleak on Windows
+
 from bk_light.config import load_config
 from bk_light.panel_manager import PanelManager
 
@@ -70,6 +74,12 @@ def char_to_brightness(char: str) -> float:
     return CHAR_BRIGHTNESS.get(char, DEFAULT_BRIGHTNESS)
 
 
+@lru_cache(maxsize=1)
+def brightness_lut(np):
+    """char_to_brightness() for every ASCII code (anything else is encoded as '?')."""
+    return np.array([char_to_brightness(chr(code)) for code in range(128)], dtype=np.float64)
+
+
 def parse_color(color_str: str) -> tuple[int, int, int]:
     """Parse color string to RGB tuple.
 
@@ -113,6 +123,107 @@ def parse_color(color_str: str) -> tuple[int, int, int]:
     return (0, 255, 0)
 
 
+def content_image(
+    lines: list[str],
+    color: tuple[int, int, int],
+    bg_color: tuple[int, int, int],
+) -> Optional[Image.Image]:
+    """Render ASCII art lines one pixel per character, cropped to the lit characters.
+
+    Pillow-only: the characters become a palette image, so no per-pixel Python runs.
+    """
+    # Pad lines to a rectangle of character codes (padding spaces are off)
+    line_width = max(len(line) for line in lines)
+    size = (line_width, len(lines))
+    codes = "".join(line.ljust(line_width) for line in lines).encode('ascii', 'replace')
+
+    # Find bounding box of actual content (lit characters)
+    brightness = [char_to_brightness(chr(code)) for code in range(128)]
+    lit = Image.frombytes('L', size, codes).point([255 if value > 0 else 0 for value in brightness] + [0] * 128)
+    bbox = lit.getbbox()
+    if bbox is None:
+        return None
+
+    # Same truncation as int(color * brightness); unlit characters keep the background
+    palette = []
+    for value in brightness:
+        palette.extend((int(channel * value) for channel in color) if value > 0 else bg_color)
+    art_image = Image.frombytes('P', size, codes)
+    art_image.putpalette(palette)
+    return art_image.crop(bbox).convert('RGB')
+
+
+def fit_size(content_width: int, content_height: int, width: int, height: int) -> tuple[int, int]:
+    """Scale content to fit width x height while maintaining aspect ratio."""
+    scale_x = width / content_width
+    scale_y = height / content_height
+    scale = min(scale_x, scale_y)
+
+    new_width = max(1, int(content_width * scale))
+    new_height = max(1, int(content_height * scale))
+    return new_width, new_height
+
+
+@lru_cache(maxsize=16)
+def art_palette(np, color: tuple[int, int, int], bg_color: tuple[int, int, int]):
+    """Pixel color per character code, as content_image() computes it.
+
+    Same truncation as int(color * brightness); unlit characters keep the background.
+    """
+    brightness = brightness_lut(np)
+    palette = (brightness[:, None] * np.array(color, dtype=np.float64)).astype(np.uint8)
+    palette[brightness <= 0] = bg_color
+    return palette
+
+
+@lru_cache(maxsize=64)
+def nearest_index(np, size: int, new_size: int):
+    """Source index of every output pixel, as Pillow's NEAREST resize picks them.
+
+    Pillow walks pixel centers by repeated addition, so accumulate the same way.
+    """
+    steps = np.full(new_size, size / new_size)
+    steps[0] *= 0.5
+    return np.add.accumulate(steps).astype(np.intp)
+
+
+def art_image_numpy(
+    np,
+    lines: list[str],
+    width: int,
+    height: int,
+    color: tuple[int, int, int],
+    bg_color: tuple[int, int, int],
+) -> Image.Image:
+    """Vectorized version of content_image() plus the resize and centering in ascii_to_image()."""
+    # Pad lines to a rectangle of character codes (padding spaces are off)
+    line_width = max(len(line) for line in lines)
+    text = "".join(line.ljust(line_width) for line in lines)
+    codes = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8).reshape(len(lines), line_width)
+    brightness = brightness_lut(np)
+
+    lit = (brightness > 0)[codes]
+    rows = np.flatnonzero(lit.any(axis=1))
+    cols = np.flatnonzero(lit.any(axis=0))
+    if not rows.size:
+        return Image.new('RGB', (width, height), bg_color)
+
+    # Crop to the content and scale it in one gather, straight from the character grid
+    content_width = int(cols[-1] - cols[0] + 1)
+    content_height = int(rows[-1] - rows[0] + 1)
+    new_width, new_height = fit_size(content_width, content_height, width, height)
+    ys = rows[0] + nearest_index(np, content_height, new_height)
+    xs = cols[0] + nearest_index(np, content_width, new_width)
+
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = bg_color
+    x_offset = (width - new_width) // 2
+    y_offset = (height - new_height) // 2
+    palette = art_palette(np, tuple(color), tuple(bg_color))
+    canvas[y_offset:y_offset + new_height, x_offset:x_offset + new_width] = palette[codes[ys][:, xs]]
+    return Image.fromarray(canvas, 'RGB')
+
+
 def ascii_to_image(
     ascii_art: str,
     width: int = 32,
@@ -143,50 +254,21 @@ def ascii_to_image(
     if not lines:
         return Image.new('RGB', (width, height), bg_color)
 
-    # Find bounding box of actual content (non-space characters)
-    min_x, max_x = float('inf'), 0
-    min_y, max_y = float('inf'), 0
+    # numpy is optional; content_image() is the fallback
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        return art_image_numpy(np, lines, width, height, color, bg_color)
 
-    for y, line in enumerate(lines):
-        for x, char in enumerate(line):
-            if char != ' ' and char_to_brightness(char) > 0:
-                min_x = min(min_x, x)
-                max_x = max(max_x, x)
-                min_y = min(min_y, y)
-                max_y = max(max_y, y)
+    art_image = content_image(lines, color, bg_color)
 
     # Handle empty art
-    if min_x == float('inf'):
+    if art_image is None:
         return Image.new('RGB', (width, height), bg_color)
 
-    # Content dimensions
-    content_width = max_x - min_x + 1
-    content_height = max_y - min_y + 1
-
-    # Create image at content size (cropped to bounding box)
-    art_image = Image.new('RGB', (content_width, content_height), bg_color)
-    pixels = art_image.load()
-
-    for y, line in enumerate(lines):
-        if y < min_y or y > max_y:
-            continue
-        for x, char in enumerate(line):
-            if x < min_x or x > max_x:
-                continue
-            brightness = char_to_brightness(char)
-            if brightness > 0:
-                r = int(color[0] * brightness)
-                g = int(color[1] * brightness)
-                b = int(color[2] * brightness)
-                pixels[x - min_x, y - min_y] = (r, g, b)
-
-    # Scale to fit display while maintaining aspect ratio
-    scale_x = width / content_width
-    scale_y = height / content_height
-    scale = min(scale_x, scale_y)
-
-    new_width = max(1, int(content_width * scale))
-    new_height = max(1, int(content_height * scale))
+    new_width, new_height = fit_size(*art_image.size, width, height)
 
     # Use NEAREST for pixel-art look
     art_image = art_image.resize((new_width, new_height), Image.Resampling.NEAREST)
@@ -204,6 +286,34 @@ def ascii_to_image(
 DOT_BRIGHT = "●"
 DOT_DIM = "•"
 DOT_OFF = " "
+DOT_DIM_MIN = 0.08  # Brightness from which a pixel shows as DOT_DIM
+DOT_BRIGHT_MIN = 0.4  # ... and as DOT_BRIGHT
+
+
+@lru_cache(maxsize=2)
+def preview_cell_table(np, use_color: bool):
+    """Console cell for every (color code - 16, dot) pair, dots ordered off/dim/bright."""
+    table = np.empty((216, 3), dtype=object)
+    for code in range(216):
+        table[code, 0] = f"{DOT_OFF} "
+        for index, dot in enumerate((DOT_DIM, DOT_BRIGHT), 1):
+            table[code, index] = f"\033[38;5;{16 + code}m{dot} " if use_color else f"{dot} "
+    return table
+
+
+def preview_cells_numpy(np, image: Image.Image):
+    """Index arrays (color code - 16, dot) into preview_cell_table(), same thresholds as the loop."""
+    arr = np.asarray(image, dtype=np.float64)
+    r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+    brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
+    # Thresholds passed (0 = off, 1 = dim, 2 = bright), without per-level masks
+    dots = np.searchsorted(np.array([DOT_DIM_MIN, DOT_BRIGHT_MIN]), brightness, side='right')
+    codes = (
+        36 * (r / 255 * 5).astype(np.intp)
+        + 6 * (g / 255 * 5).astype(np.intp)
+        + (b / 255 * 5).astype(np.intp)
+    )
+    return codes, dots
 
 
 def render_console_preview(image: Image.Image, use_color: bool = True) -> str:
@@ -216,11 +326,21 @@ def render_console_preview(image: Image.Image, use_color: bool = True) -> str:
     Returns:
         Dot-matrix string ready to print
     """
+    RESET = "\033[0m"
+
+    # numpy is optional; the per-pixel loop below is the fallback
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        rows = preview_cell_table(np, use_color)[preview_cells_numpy(np, image)].tolist()
+        return "\n".join("".join(row) + RESET if use_color else "".join(row) for row in rows)
+
     width, height = image.size
     pixels = image.load()
 
     lines = []
-    RESET = "\033[0m"
 
     for y in range(height):
         line = ""
@@ -229,14 +349,14 @@ def render_console_preview(image: Image.Image, use_color: bool = True) -> str:
             brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
 
             # Choose dot based on brightness
-            if brightness < 0.08:
+            if brightness < DOT_DIM_MIN:
                 dot = DOT_OFF
-            elif brightness < 0.4:
+            elif brightness < DOT_BRIGHT_MIN:
                 dot = DOT_DIM
             else:
                 dot = DOT_BRIGHT
 
-            if use_color and brightness >= 0.08:
+            if use_color and brightness >= DOT_DIM_MIN:
                 # Map RGB to 256-color terminal palette
                 r_term = int(r / 255 * 5)
                 g_term = int(g / 255 * 5)
@@ -251,184 +371,209 @@ def render_console_preview(image: Image.Image, use_color: bool = True) -> str:
     return "\n".join(lines)
 
 
-def print_console_preview(image: Image.Image, title: str = "", use_color: bool = True) -> None:
-    """Clear screen and print dot-matrix preview."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    if title:
-        print(title + "\n")
-    print(render_console_preview(image, use_color))
-    print()
+@lru_cache(maxsize=1)
+def init_console() -> None:
+    """Enable ANSI escapes (Windows) and clear the screen once; previews then redraw in place."""
+    if os.name == 'nt':
+        os.system('')
+    sys.stdout.write("\033[2J")
 
 
-# Story definitions: list of (art_name, duration, caption)
+def print_console_preview(
+    image: Image.Image,
+    title: str = "",
+    use_color: bool = True,
+    rendered: Optional[str] = None,
+) -> None:
+    """Clear screen and print dot-matrix preview.
+
+    rendered: render_console_preview() output for image, for callers that show it repeatedly
+    """
+    if rendered is None:
+        rendered = render_console_preview(image, use_color)
+    init_console()
+
+    # Cursor-home and overdraw in one write instead of spawning cls/clear every frame
+    text = "\033[H" + (title + "\033[K\n\n" if title else "") + rendered + "\n\n\033[J"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. an IDE console that replaced stdout
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()  # Keep ordering with anything print()ed before
+    buffer.write(text.encode(sys.stdout.encoding or "utf-8", "replace"))
+    buffer.flush()
+
+
+# Story definitions: (art_name, duration) scenes
 STORIES = {
-    'chase': [
-        ('pacman', 0.5, None),
-        ('ghost', 0.4, None),
-        ('pacman', 0.5, None),
-        ('ghost', 0.4, None),
-        ('ghost', 0.3, None),
-        ('explosion', 0.4, None),
-        ('skull', 0.8, None),
-        ('star', 0.6, None),  # Game over
-    ],
-    'love': [
-        ('smiley', 0.8, None),
-        ('heart', 0.6, None),
-        ('smiley', 0.6, None),
-        ('heart', 0.6, None),
-        ('diamond', 0.8, None),  # Engagement
-        ('crown', 0.8, None),    # Wedding
-        ('heart', 0.6, None),
-        ('star', 1.0, None),
-    ],
-    'invasion': [
-        ('moon', 0.6, None),
-        ('star', 0.5, None),
-        ('rocket', 0.5, None),
-        ('alien', 0.4, None),
-        ('invader', 0.4, None),
-        ('alien', 0.4, None),
-        ('robot', 0.5, None),
-        ('explosion', 0.4, None),
-        ('fire', 0.5, None),
-        ('skull', 0.8, None),
-    ],
-    'halloween': [
-        ('moon', 0.6, None),
-        ('cat', 0.5, None),
-        ('ghost', 0.5, None),
-        ('skull', 0.5, None),
-        ('fire', 0.4, None),
-        ('ghost', 0.5, None),
-        ('skull_bones', 0.6, None),
-        ('cat', 0.5, None),
-        ('moon', 0.8, None),
-    ],
-    'adventure': [
-        ('smiley', 0.5, None),
-        ('house', 0.5, None),
-        ('door', 0.4, None),
-        ('key', 0.5, None),
-        ('door', 0.4, None),
-        ('sword', 0.5, None),
-        ('shield', 0.5, None),
-        ('alien', 0.4, None),
-        ('explosion', 0.4, None),
-        ('coin', 0.5, None),
-        ('diamond', 0.5, None),
-        ('crown', 0.6, None),
-        ('star', 0.8, None),
-    ],
-    'weather': [
-        ('sun', 0.7, None),
-        ('cloud', 0.5, None),
-        ('rain', 0.6, None),
-        ('lightning', 0.3, None),
-        ('rain', 0.5, None),
-        ('cloud', 0.5, None),
-        ('sun', 0.8, None),
-        ('bird', 0.6, None),
-    ],
-    'ocean': [
-        ('sun', 0.6, None),
-        ('water', 0.5, None),
-        ('fish', 0.5, None),
-        ('water', 0.4, None),
-        ('fish', 0.5, None),
-        ('bird', 0.5, None),
-        ('sun', 0.6, None),
-        ('moon', 0.6, None),
-        ('star', 0.8, None),
-    ],
-    'space': [
-        ('star', 0.5, None),
-        ('moon', 0.5, None),
-        ('rocket', 0.5, None),
-        ('star', 0.4, None),
-        ('alien', 0.5, None),
-        ('robot', 0.5, None),
-        ('explosion', 0.4, None),
-        ('star', 0.5, None),
-        ('sun', 0.8, None),
-    ],
-    'dungeon': [
-        ('door', 0.5, None),
-        ('key', 0.4, None),
-        ('door', 0.4, None),
-        ('skull', 0.5, None),
-        ('sword', 0.4, None),
-        ('explosion', 0.4, None),
-        ('potion', 0.5, None),
-        ('heart', 0.5, None),
-        ('coin', 0.4, None),
-        ('diamond', 0.5, None),
-        ('door', 0.4, None),
-        ('crown', 0.6, None),
-        ('star', 0.8, None),
-    ],
-    'forest': [
-        ('sun', 0.6, None),
-        ('tree', 0.5, None),
-        ('bird', 0.5, None),
-        ('tree', 0.4, None),
-        ('cat', 0.5, None),
-        ('fish', 0.5, None),
-        ('tree', 0.4, None),
-        ('moon', 0.6, None),
-        ('star', 0.8, None),
-    ],
-    'battle': [
-        ('robot', 0.5, None),
-        ('alien', 0.5, None),
-        ('sword', 0.4, None),
-        ('shield', 0.4, None),
-        ('explosion', 0.3, None),
-        ('fire', 0.4, None),
-        ('explosion', 0.3, None),
-        ('skull', 0.5, None),
-        ('crown', 0.6, None),
-        ('star', 0.8, None),
-    ],
-    'party': [
-        ('smiley', 0.5, None),
-        ('music', 0.5, None),
-        ('star', 0.4, None),
-        ('heart', 0.4, None),
-        ('music', 0.4, None),
-        ('diamond', 0.4, None),
-        ('star', 0.4, None),
-        ('crown', 0.5, None),
-        ('explosion', 0.4, None),
-        ('star', 0.8, None),
-    ],
-    'nightmare': [
-        ('moon', 0.5, None),
-        ('ghost', 0.4, None),
-        ('skull', 0.4, None),
-        ('alien', 0.4, None),
-        ('fire', 0.4, None),
-        ('skull_bones', 0.5, None),
-        ('lightning', 0.3, None),
-        ('ghost', 0.4, None),
-        ('explosion', 0.4, None),
-        ('sun', 0.6, None),  # Wake up
-        ('smiley', 0.8, None),
-    ],
-    'treasure': [
-        ('house', 0.5, None),
-        ('door', 0.4, None),
-        ('key', 0.4, None),
-        ('door', 0.4, None),
-        ('skull', 0.4, None),
-        ('sword', 0.4, None),
-        ('coin', 0.4, None),
-        ('coin', 0.3, None),
-        ('diamond', 0.5, None),
-        ('crown', 0.6, None),
-        ('heart', 0.5, None),
-        ('star', 0.8, None),
-    ],
+    'chase': (
+        ('pacman', 0.5),
+        ('ghost', 0.4),
+        ('pacman', 0.5),
+        ('ghost', 0.4),
+        ('ghost', 0.3),
+        ('explosion', 0.4),
+        ('skull', 0.8),
+        ('star', 0.6),  # Game over
+    ),
+    'love': (
+        ('smiley', 0.8),
+        ('heart', 0.6),
+        ('smiley', 0.6),
+        ('heart', 0.6),
+        ('diamond', 0.8),  # Engagement
+        ('crown', 0.8),    # Wedding
+        ('heart', 0.6),
+        ('star', 1.0),
+    ),
+    'invasion': (
+        ('moon', 0.6),
+        ('star', 0.5),
+        ('rocket', 0.5),
+        ('alien', 0.4),
+        ('invader', 0.4),
+        ('alien', 0.4),
+        ('robot', 0.5),
+        ('explosion', 0.4),
+        ('fire', 0.5),
+        ('skull', 0.8),
+    ),
+    'halloween': (
+        ('moon', 0.6),
+        ('cat', 0.5),
+        ('ghost', 0.5),
+        ('skull', 0.5),
+        ('fire', 0.4),
+        ('ghost', 0.5),
+        ('skull_bones', 0.6),
+        ('cat', 0.5),
+        ('moon', 0.8),
+    ),
+    'adventure': (
+        ('smiley', 0.5),
+        ('house', 0.5),
+        ('door', 0.4),
+        ('key', 0.5),
+        ('door', 0.4),
+        ('sword', 0.5),
+        ('shield', 0.5),
+        ('alien', 0.4),
+        ('explosion', 0.4),
+        ('coin', 0.5),
+        ('diamond', 0.5),
+        ('crown', 0.6),
+        ('star', 0.8),
+    ),
+    'weather': (
+        ('sun', 0.7),
+        ('cloud', 0.5),
+        ('rain', 0.6),
+        ('lightning', 0.3),
+        ('rain', 0.5),
+        ('cloud', 0.5),
+        ('sun', 0.8),
+        ('bird', 0.6),
+    ),
+    'ocean': (
+        ('sun', 0.6),
+        ('water', 0.5),
+        ('fish', 0.5),
+        ('water', 0.4),
+        ('fish', 0.5),
+        ('bird', 0.5),
+        ('sun', 0.6),
+        ('moon', 0.6),
+        ('star', 0.8),
+    ),
+    'space': (
+        ('star', 0.5),
+        ('moon', 0.5),
+        ('rocket', 0.5),
+        ('star', 0.4),
+        ('alien', 0.5),
+        ('robot', 0.5),
+        ('explosion', 0.4),
+        ('star', 0.5),
+        ('sun', 0.8),
+    ),
+    'dungeon': (
+        ('door', 0.5),
+        ('key', 0.4),
+        ('door', 0.4),
+        ('skull', 0.5),
+        ('sword', 0.4),
+        ('explosion', 0.4),
+        ('potion', 0.5),
+        ('heart', 0.5),
+        ('coin', 0.4),
+        ('diamond', 0.5),
+        ('door', 0.4),
+        ('crown', 0.6),
+        ('star', 0.8),
+    ),
+    'forest': (
+        ('sun', 0.6),
+        ('tree', 0.5),
+        ('bird', 0.5),
+        ('tree', 0.4),
+        ('cat', 0.5),
+        ('fish', 0.5),
+        ('tree', 0.4),
+        ('moon', 0.6),
+        ('star', 0.8),
+    ),
+    'battle': (
+        ('robot', 0.5),
+        ('alien', 0.5),
+        ('sword', 0.4),
+        ('shield', 0.4),
+        ('explosion', 0.3),
+        ('fire', 0.4),
+        ('explosion', 0.3),
+        ('skull', 0.5),
+        ('crown', 0.6),
+        ('star', 0.8),
+    ),
+    'party': (
+        ('smiley', 0.5),
+        ('music', 0.5),
+        ('star', 0.4),
+        ('heart', 0.4),
+        ('music', 0.4),
+        ('diamond', 0.4),
+        ('star', 0.4),
+        ('crown', 0.5),
+        ('explosion', 0.4),
+        ('star', 0.8),
+    ),
+    'nightmare': (
+        ('moon', 0.5),
+        ('ghost', 0.4),
+        ('skull', 0.4),
+        ('alien', 0.4),
+        ('fire', 0.4),
+        ('skull_bones', 0.5),
+        ('lightning', 0.3),
+        ('ghost', 0.4),
+        ('explosion', 0.4),
+        ('sun', 0.6),  # Wake up
+        ('smiley', 0.8),
+    ),
+    'treasure': (
+        ('house', 0.5),
+        ('door', 0.4),
+        ('key', 0.4),
+        ('door', 0.4),
+        ('skull', 0.4),
+        ('sword', 0.4),
+        ('coin', 0.4),
+        ('coin', 0.3),
+        ('diamond', 0.5),
+        ('crown', 0.6),
+        ('heart', 0.5),
+        ('star', 0.8),
+    ),
 }
 
 
@@ -1106,6 +1251,20 @@ ASCII_ART_EXAMPLES = {
 }
 
 
+@lru_cache(maxsize=64)
+def get_art_image(
+    art_name: str,
+    width: int,
+    height: int,
+    color: tuple[int, int, int],
+) -> Image.Image:
+    """ascii_to_image() of a built-in example, rendered once per size and color.
+
+    The image is shared between callers, so treat it as read-only.
+    """
+    return ascii_to_image(ASCII_ART_EXAMPLES[art_name], width, height, color)
+
+
 def lerp_images(img1: Image.Image, img2: Image.Image, t: float) -> Image.Image:
     """Linear interpolation between two images.
 
@@ -1117,6 +1276,17 @@ def lerp_images(img1: Image.Image, img2: Image.Image, t: float) -> Image.Image:
     Returns:
         Blended image
     """
+    # numpy is optional; the per-pixel loop below is the fallback
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        a = np.asarray(img1, dtype=np.int16)
+        b = np.asarray(img2, dtype=np.int16)
+        # Float blend, truncated like int(): same pixels as the loop
+        return Image.fromarray((a + (b - a) * t).astype(np.uint8), 'RGB')
+
     width, height = img1.size
     result = Image.new('RGB', (width, height), (0, 0, 0))
 
@@ -1173,52 +1343,50 @@ async def display_story(
         await manager.__aenter__()
         width, height = manager.canvas_size
 
-    # Pre-render all frames
+    # Pre-render all frames, with their previews (arts repeat within and across replays)
     art_cache = {}
-    for art_name, _, _ in story:
+    preview_cache = {}
+    for art_name, _ in story:
         if art_name not in art_cache and art_name in ASCII_ART_EXAMPLES:
-            art_cache[art_name] = ascii_to_image(
-                ASCII_ART_EXAMPLES[art_name], width, height, color
-            )
+            art_cache[art_name] = get_art_image(art_name, width, height, color)
+            preview_cache[art_name] = render_console_preview(art_cache[art_name], use_color)
+
+    # Everything per scene is fixed for the whole story: (image, preview, duration, title, morph target)
+    scenes = []
+    for i, (art_name, duration) in enumerate(story):
+        if art_name not in art_cache:
+            continue
+        next_img = None
+        if morph and i < len(story) - 1:
+            next_img = art_cache.get(story[i + 1][0])
+        title = f"Story: {story_name} - {art_name} - Ctrl+C to exit"
+        scenes.append((art_cache[art_name], preview_cache[art_name], duration / speed, title, next_img))
 
     print(f"\033[?25l", end="")  # Hide cursor
 
     try:
         while True:
-            for i, (art_name, duration, caption) in enumerate(story):
-                if art_name not in art_cache:
-                    continue
-
-                current_img = art_cache[art_name]
-                adjusted_duration = duration / speed
-
+            for current_img, preview, adjusted_duration, title, next_img in scenes:
                 # Show current frame
-                title = f"Story: {story_name} - {art_name} - Ctrl+C to exit"
-                print_console_preview(current_img, title, use_color)
+                print_console_preview(current_img, title, use_color, preview)
 
                 if manager:
                     await manager.send_image(current_img, delay=0.05)
 
                 # Morph to next frame if enabled
-                if morph and i < len(story) - 1:
-                    next_art = story[i + 1][0]
-                    if next_art in art_cache:
-                        next_img = art_cache[next_art]
-
-                        # Hold then morph
-                        await asyncio.sleep(adjusted_duration * 0.6)
-
-                        # Quick morph transition
-                        morph_steps = 8
-                        for step in range(1, morph_steps + 1):
-                            t = ease_in_out(step / morph_steps)
-                            frame = lerp_images(current_img, next_img, t)
-                            print_console_preview(frame, title, use_color)
-                            if manager:
-                                await manager.send_image(frame, delay=0.03)
-                            await asyncio.sleep(adjusted_duration * 0.4 / morph_steps)
-                    else:
-                        await asyncio.sleep(adjusted_duration)
+                if next_img is not None:
+                    # Hold then morph
+                    await asyncio.sleep(adjusted_duration * 0.6)
+
+                    # Quick morph transition
+                    morph_steps = 8
+                    for step in range(1, morph_steps + 1):
+                        t = ease_in_out(step / morph_steps)
+                        frame = lerp_images(current_img, next_img, t)
+                        print_console_preview(frame, title, use_color)
+                        if manager:
+                            await manager.send_image(frame, delay=0.03)
+                        await asyncio.sleep(adjusted_duration * 0.4 / morph_steps)
                 else:
                     await asyncio.sleep(adjusted_duration)
 
@@ -1257,13 +1425,11 @@ async def display_morphing_art(
     # Convert all arts to images
     images = []
     for name in art_names:
-        if name in ASCII_ART_EXAMPLES:
-            art = ASCII_ART_EXAMPLES[name]
-        else:
+        if name not in ASCII_ART_EXAMPLES:
             print(f"Warning: Unknown art '{name}', skipping")
             continue
-        img = ascii_to_image(art, width, height, color)
-        images.append((name, img))
+        img = get_art_image(name, width, height, color)
+        images.append((name, img, render_console_preview(img, use_color)))
 
     if len(images) < 2:
         print("Error: Need at least 2 arts for morphing")
@@ -1276,13 +1442,13 @@ async def display_morphing_art(
         idx = 0
 
         while True:
-            current_name, current_img = images[idx]
+            current_name, current_img, current_preview = images[idx]
             next_idx = (idx + 1) % len(images)
-            next_name, next_img = images[next_idx]
+            next_name, next_img, _ = images[next_idx]
 
             # Hold on current image
             title = f"Morphing: {current_name} - {width}x{height} - Ctrl+C to exit"
-            print_console_preview(current_img, title, use_color)
+            print_console_preview(current_img, title, use_color, current_preview)
             if manager:
                 await manager.send_image(current_img, delay=0.1)
             await asyncio.sleep(hold_time)
@@ -1,40 +1,22 @@
 import argparse
 import asyncio
 import sys
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
+from bk_light.colors import parse_color
 from bk_light.config import AppConfig, clock_options, load_config
 from bk_light.fonts import get_font_profile, resolve_font
 from bk_light.panel_manager import PanelManager
-
-
-def parse_color(value: Optional[str]) -> Optional[tuple[int, int, int]]:
-    if value is None:
-        return None
-    cleaned = value.replace("#", "").replace(" ", "")
-    if "," in cleaned:
-        parts = cleaned.split(",")
-        return tuple(int(part) for part in parts[:3])
-    if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
-    raise ValueError("Invalid color")
-
-
-def load_font(path: Optional[Path], size: int) -> ImageFont.ImageFont:
-    if path is None:
-        return ImageFont.load_default()
-    try:
-        return ImageFont.truetype(str(path), size)
-    except Exception:
-        return ImageFont.load_default()
+from bk_light.text import load_font
 
 
 def resolve_timezone(config: AppConfig, override: Optional[str]) -> timezone:
@@ -48,22 +30,23 @@ def resolve_timezone(config: AppConfig, override: Optional[str]) -> timezone:
         return datetime.now().astimezone().tzinfo or timezone.utc
 
 
-def build_clock_image(
-    canvas: tuple[int, int],
-    text: str,
-    color: tuple[int, int, int],
-    accent: tuple[int, int, int],
-    background: tuple[int, int, int],
+@dataclass(frozen=True)
+class DigitGlyphs:
+    glyphs: dict[str, Image.Image]
+    bboxes: dict[str, tuple[int, int, int, int]]
+    max_width: int
+    top: int
+    height: int
+
+
+@lru_cache(maxsize=8)
+def render_digit_glyphs(
     font_path: Optional[Path],
     size: int,
-    colon_visible: bool,
+    color: tuple[int, int, int],
     antialias: bool,
-    offset_x: int,
-    offset_y: int,
-    colon_dx: int,
-    colon_top_adjust: int,
-    colon_bottom_adjust: int,
-) -> Image.Image:
+) -> DigitGlyphs:
+    """Rasterize 0-9 once per font, size and colour; clock ticks only composite them."""
     font = load_font(font_path, size)
     mask_mode = "L" if antialias else "1"
     dummy = Image.new(mask_mode, (1, 1), 0)
@@ -96,7 +79,39 @@ def build_clock_image(
     if digit_top is None or digit_bottom is None:
         digit_top = 0
         digit_bottom = size
-    digit_height = max(1, digit_bottom - digit_top)
+    return DigitGlyphs(
+        glyphs=digit_glyphs,
+        bboxes=digit_bboxes,
+        max_width=max_digit_width,
+        top=digit_top,
+        height=max(1, digit_bottom - digit_top),
+    )
+
+
+def build_clock_image(
+    canvas: tuple[int, int],
+    text: str,
+    color: tuple[int, int, int],
+    accent: tuple[int, int, int],
+    background: tuple[int, int, int],
+    font_path: Optional[Path],
+    size: int,
+    colon_visible: bool,
+    antialias: bool,
+    offset_x: int,
+    offset_y: int,
+    colon_dx: int,
+    colon_top_adjust: int,
+    colon_bottom_adjust: int,
+    frame: Optional[Image.Image] = None,
+) -> Image.Image:
+    """Compose the clock face; pass ``frame`` (RGBA, canvas sized) to reuse it across ticks."""
+    digits = render_digit_glyphs(font_path, size, tuple(color), antialias)
+    digit_glyphs = digits.glyphs
+    digit_bboxes = digits.bboxes
+    max_digit_width = digits.max_width
+    digit_top = digits.top
+    digit_height = digits.height
     def render_segment(segment: str) -> Image.Image:
         if not segment:
             return Image.new("RGBA", (1, digit_height), (0, 0, 0, 0))
@@ -123,7 +138,11 @@ def build_clock_image(
     extra_gap = 1 if right_text else 0
     colon_width = 1 if right_text else 0
     total_width = left_segment.width + extra_gap + colon_width + right_segment.width
-    frame = Image.new("RGBA", canvas, tuple(background) + (255,))
+    fill = tuple(background) + (255,)
+    if frame is None or frame.size != canvas:
+        frame = Image.new("RGBA", canvas, fill)
+    else:
+        frame.paste(fill, (0, 0, canvas[0], canvas[1]))
     origin_x = int((canvas[0] - total_width) // 2) + offset_x
     origin_y = int((canvas[1] - digit_height) // 2) + offset_y
     frame.alpha_composite(left_segment, (origin_x, origin_y))
@@ -179,6 +198,7 @@ async def run_clock(config: AppConfig, preset_name: str, overrides: dict[str, Op
     interval = preset.interval
     dot_flashing = preset.dot_flashing
     flash_period = preset.dot_flash_period
+    twelve_hour = preset.format == "12h"
     last_stamp = ""
     last_colon = True
     loop = asyncio.get_running_loop()
@@ -186,17 +206,17 @@ async def run_clock(config: AppConfig, preset_name: str, overrides: dict[str, Op
     try:
         async with PanelManager(config) as manager:
             canvas = manager.canvas_size
+            # send_image encodes before returning, so one scratch canvas is safe to reuse.
+            scratch = Image.new("RGBA", canvas)
             while True:
                 now = datetime.now(tz)
-                if preset.format == "12h":
-                    stamp = now.strftime("%I:%M")
-                    if stamp.startswith("0"):
-                        stamp = stamp[1:]
+                if twelve_hour:
+                    stamp = f"{now.hour % 12 or 12}:{now.minute:02d}"
                 else:
-                    stamp = now.strftime("%H:%M")
-                elapsed = loop.time() - start_time
+                    stamp = f"{now.hour:02d}:{now.minute:02d}"
                 colon_visible = True
                 if dot_flashing:
+                    elapsed = loop.time() - start_time
                     colon_visible = int(elapsed / flash_period) % 2 == 0
                 if stamp != last_stamp or colon_visible != last_colon:
                     image = build_clock_image(
@@ -214,8 +234,9 @@ async def run_clock(config: AppConfig, preset_name: str, overrides: dict[str, Op
                         profile.colon_dx,
                         profile.colon_top_adjust,
                         profile.colon_bottom_adjust,
+                        scratch,
                     )
-                    await manager.send_image(image, delay=0.15)
+                    await manager.send_image_prechecked(image, delay=0.15)
                     last_stamp = stamp
                     last_colon = colon_visible
                 await asyncio.sleep(interval)
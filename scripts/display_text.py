@@ -10,24 +10,13 @@ project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
+from bk_light.colors import parse_color
 from bk_light.config import AppConfig, load_config, text_options
 from bk_light.fonts import get_font_profile, resolve_font
 from bk_light.panel_manager import PanelManager
 from bk_light.text import build_text_bitmap
 
 
-def parse_color(value: Optional[str]) -> Optional[tuple[int, int, int]]:
-    if value is None:
-        return None
-    cleaned = value.replace("#", "").replace(" ", "")
-    if "," in cleaned:
-        parts = cleaned.split(",")
-        return tuple(int(part) for part in parts[:3])
-    if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
-    raise ValueError("Invalid color")
-
-
 def render_static_frame(
     canvas: tuple[int, int],
     text_bitmap: Image.Image,
@@ -119,7 +108,7 @@ async def display_text(config: AppConfig, message: str, preset_name: str, overri
                         offset_y_base,
                         position,
                     )
-                    await manager.send_image(frame, delay=0.1)
+                    await manager.send_image_prechecked(frame, delay=0.1)
                     await asyncio.sleep(preset.interval)
                     position = (position + step) % strip_width
             else:
@@ -130,7 +119,7 @@ async def display_text(config: AppConfig, message: str, preset_name: str, overri
                     offset_x_base,
                     offset_y_base,
                 )
-                await manager.send_image(frame, delay=0.15)
+                await manager.send_image_prechecked(frame, delay=0.15)
                 await asyncio.sleep(0.2)
     except asyncio.CancelledError:
         raise
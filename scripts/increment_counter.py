@@ -10,22 +10,13 @@ project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
+from bk_light.colors import parse_color
 from bk_light.config import AppConfig, counter_options, load_config, text_options
 from bk_light.fonts import get_font_profile, resolve_font
 from bk_light.panel_manager import PanelManager
 from bk_light.text import build_text_bitmap
 
 
-def parse_color(value: str) -> tuple[int, int, int]:
-    cleaned = value.replace("#", "").replace(" ", "")
-    if "," in cleaned:
-        parts = cleaned.split(",")
-        return tuple(int(part) for part in parts[:3])
-    if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
-    raise ValueError("Invalid color")
-
-
 def build_counter_image(
     canvas: tuple[int, int],
     value: int,
@@ -37,7 +28,9 @@ def build_counter_image(
     offset_x: int,
     offset_y: int,
     antialias: bool,
+    frame: Optional[Image.Image] = None,
 ) -> Image.Image:
+    """Render the counter; pass ``frame`` (RGBA, canvas sized) to reuse it across ticks."""
     text_bitmap = build_text_bitmap(
         str(value),
         font_path,
@@ -47,7 +40,11 @@ def build_counter_image(
         antialias,
         monospace_digits=True,
     )
-    frame = Image.new("RGBA", canvas, tuple(background) + (255,))
+    fill = tuple(background) + (255,)
+    if frame is None or frame.size != canvas:
+        frame = Image.new("RGBA", canvas, fill)
+    else:
+        frame.paste(fill, (0, 0, canvas[0], canvas[1]))
     origin_x = (canvas[0] - text_bitmap.width) // 2 + offset_x
     origin_y = (canvas[1] - text_bitmap.height) // 2 + offset_y
     frame.paste(text_bitmap, (origin_x, origin_y), text_bitmap)
@@ -78,6 +75,8 @@ async def run_counter(config: AppConfig, preset_name: str, overrides: dict[str,
     interval = float(delay) if delay is not None else counter_preset.delay
     async with PanelManager(config) as manager:
         canvas = manager.canvas_size
+        # send_image encodes before returning, so one scratch canvas is safe to reuse.
+        scratch = Image.new("RGBA", canvas)
         value = start_value
         for _ in range(total):
             image = build_counter_image(
@@ -91,8 +90,9 @@ async def run_counter(config: AppConfig, preset_name: str, overrides: dict[str,
                 offset_x,
                 offset_y,
                 config.display.antialias_text,
+                scratch,
             )
-            await manager.send_image(image, delay=0.15)
+            await manager.send_image_prechecked(image, delay=0.15)
             value += 1
             await asyncio.sleep(interval)
 
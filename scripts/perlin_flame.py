@@ -337,11 +337,12 @@ async def run_perlin_flame(
     t = 0.0
     frame_interval = 1.0 / fps
     frame_count = 0
-    start_time = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
 
     try:
         while True:
-            frame_start = asyncio.get_event_loop().time()
+            frame_start = loop.time()
 
             frame = generate_frame(
                 width, height, t,
@@ -384,9 +385,9 @@ async def run_perlin_flame(
             print_console_preview(frame, title)
 
             if manager:
-                send_start = asyncio.get_event_loop().time()
+                send_start = loop.time()
                 await manager.send_image(frame, delay=0.01)
-                send_time = asyncio.get_event_loop().time() - send_start
+                send_time = loop.time() - send_start
                 if debug:
                     print(f"Frame {frame_count} sent in {send_time*1000:.0f}ms")
 
@@ -394,7 +395,7 @@ async def run_perlin_flame(
             t += speed
 
             # Compensate for frame generation and send time
-            elapsed = asyncio.get_event_loop().time() - frame_start
+            elapsed = loop.time() - frame_start
             sleep_time = max(0, frame_interval - elapsed)
             if sleep_time > 0:
                 await asyncio.sleep(sleep_time)
@@ -404,7 +405,7 @@ async def run_perlin_flame(
     finally:
         print(f"\033[?25h", end="")  # Show cursor
         if debug:
-            total_time = asyncio.get_event_loop().time() - start_time
+            total_time = loop.time() - start_time
             print(f"\nTotal: {frame_count} frames in {total_time:.1f}s ({frame_count/total_time:.1f} FPS)")
         if manager:
             await manager.__aexit__(None, None, None)
@@ -197,11 +197,12 @@ async def run_animation(
     t = 0.0
     frame_interval = 1.0 / fps
     frame_count = 0
-    start_time = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
 
     try:
         while True:
-            frame_start = asyncio.get_event_loop().time()
+            frame_start = loop.time()
 
             # Generate frame
             frame = generate_frame(width, height, t, **kwargs)
@@ -219,17 +220,17 @@ async def run_animation(
 
             # Send to device
             if manager:
-                send_start = asyncio.get_event_loop().time()
+                send_start = loop.time()
                 await manager.send_image(frame, delay=0.01)
                 if debug:
-                    send_time = asyncio.get_event_loop().time() - send_start
+                    send_time = loop.time() - send_start
                     print(f"Frame {frame_count} sent in {send_time*1000:.0f}ms")
 
             frame_count += 1
             t += speed
 
             # Maintain target FPS
-            elapsed = asyncio.get_event_loop().time() - frame_start
+            elapsed = loop.time() - frame_start
             sleep_time = max(0, frame_interval - elapsed)
             if sleep_time > 0:
                 await asyncio.sleep(sleep_time)
@@ -239,7 +240,7 @@ async def run_animation(
     finally:
         print(f"\033[?25h", end="")  # Show cursor
         if debug:
-            total_time = asyncio.get_event_loop().time() - start_time
+            total_time = loop.time() - start_time
             print(f"\nTotal: {frame_count} frames in {total_time:.1f}s ({frame_count/total_time:.1f} FPS)")
         if manager:
             await manager.__aexit__(None, None, None)
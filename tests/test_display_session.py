@@ -0,0 +1,13 @@
+import pytest
+from PIL import Image, ImageEnhance
+
+from bk_light.display_session import _brightness_lut
+
+
+@pytest.mark.parametrize("brightness", [step / 100 for step in range(0, 301)])
+def test_brightness_lut_matches_image_enhance(brightness):
+    ramp = Image.new("L", (256, 1))
+    ramp.putdata(range(256))
+    ramp = ramp.convert("RGB")
+    expected = ImageEnhance.Brightness(ramp).enhance(brightness)
+    assert ramp.point(_brightness_lut(brightness)).tobytes() == expected.tobytes()